@@ -1370,13 +1370,13 @@ You can ask questions about these documents by mentioning me in any channel!""")
             print("Error: DISCORD_BOT_TOKEN not found in environment variables", file=sys.stderr)
             sys.exit(1)
         
-        # Start Discord bot in the background
-        bot_task = asyncio.create_task(self.bot.start(token))
+        # Log in first so the ready event exists, then connect in the background
+        await self.bot.login(token)
+        bot_task = asyncio.create_task(self.bot.connect())
         
         # Wait for bot to be ready
         print("Waiting for Discord bot to connect...", file=sys.stderr)
-        while not self.bot.is_ready():
-            await asyncio.sleep(0.1)
+        await self.bot.wait_until_ready()
         print(f"Discord bot connected as {self.bot.user}", file=sys.stderr)
         
         # Start alert HTTP server
@@ -4,21 +4,70 @@ PaladinAI client for Discord MCP server
 Handles communication with PaladinAI server for memory storage
 """
 import os
+import logging
 import aiohttp
 import asyncio
-from typing import Dict, Any, Optional
+import orjson
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_exponential
+)
 
 # Load environment variables
 load_dotenv(Path(__file__).parent.parent.parent.parent / '.env')
 
+logger = logging.getLogger(__name__)
+
+PALADIN_BASE_URL = f"http://{os.getenv('SERVER_HOST', '127.0.0.1')}:{os.getenv('SERVER_PORT', '8000')}"
+JSON_HEADERS = {"Content-Type": "application/json"}
+SEARCH_MEMORY_TYPES = ("instruction", "extracted", "discord")
+# Overall time allowed for a request including retries; the worker waits this long
+REQUEST_BUDGET_SECONDS = 60
+
+class TransientServerError(Exception):
+    """Raised for 5xx responses so the request can be retried"""
+    
+    def __init__(self, status: int, body: bytes):
+        super().__init__(f"Server returned {status}")
+        self.status = status
+        self.body = body
+
 class PaladinClient:
     """Client for interacting with PaladinAI server"""
     
     def __init__(self):
-        self.base_url = f"http://{os.getenv('SERVER_HOST', '127.0.0.1')}:{os.getenv('SERVER_PORT', '8000')}"
-        self.timeout = aiohttp.ClientTimeout(total=60)
+        self.base_url = PALADIN_BASE_URL
+        self.instruction_url = f"{self.base_url}/api/memory/instruction"
+        self.search_url = f"{self.base_url}/api/memory/search"
+        self.timeout = aiohttp.ClientTimeout(total=60, connect=5, sock_read=30)
+    
+    @retry(
+        wait=wait_exponential(multiplier=0.5, max=8),
+        stop=stop_after_attempt(5) | stop_after_delay(REQUEST_BUDGET_SECONDS),
+        retry=retry_if_exception_type((aiohttp.ClientConnectorError, TransientServerError)),
+        reraise=True
+    )
+    async def _post(self, session: aiohttp.ClientSession, url: str, body: bytes) -> Tuple[int, bytes]:
+        """
+        POST a pre-serialized JSON body, retrying failed connects and 5xx responses
+        
+        The instruction endpoint is not idempotent, so timeouts and dropped
+        connections are not retried: the server may already have stored the memory.
+        
+        Returns:
+            Response status and raw body; 4xx responses are returned without retrying
+        """
+        async with session.post(url, data=body, headers=JSON_HEADERS, timeout=self.timeout) as response:
+            body = await response.read()
+            if response.status >= 500:
+                raise TransientServerError(response.status, body)
+            return response.status, body
     
     async def store_memory_instruction(self, instruction: str, user_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -32,7 +81,7 @@ class PaladinClient:
         Returns:
             Response from server
         """
-        url = f"{self.base_url}/api/memory/instruction"
+        url = self.instruction_url
         
         payload = {
             "instruction": instruction,
@@ -42,55 +91,55 @@ class PaladinClient:
         
         async with aiohttp.ClientSession() as session:
             try:
-                async with session.post(url, json=payload, timeout=self.timeout) as response:
-                    result = await response.json()
+                status, body = await self._post(session, url, orjson.dumps(payload))
+                result = orjson.loads(body)
+                
+                if status == 200:
+                    return {
+                        "success": True,
+                        "memory_id": result.get("memory_id"),
+                        "relationships_count": result.get("relationships_count", 0),
+                        "memory_type": result.get("memory_type")
+                    }
+                else:
+                    return {
+                        "success": False,
+                        "error": f"Server returned {status}: {result.get('detail', 'Unknown error')}"
+                    }
                     
-                    if response.status == 200:
-                        return {
-                            "success": True,
-                            "memory_id": result.get("memory_id"),
-                            "relationships_count": result.get("relationships_count", 0),
-                            "memory_type": result.get("memory_type")
-                        }
-                    else:
-                        return {
-                            "success": False,
-                            "error": f"Server returned {response.status}: {result.get('detail', 'Unknown error')}"
-                        }
-                        
+            except TransientServerError as e:
+                return {"success": False, "error": str(e)}
             except asyncio.TimeoutError:
                 return {"success": False, "error": "Request timeout"}
             except Exception as e:
                 return {"success": False, "error": str(e)}
     
-    async def extract_and_store_memory(self, message_data: Dict[str, Any]) -> Dict[str, Any]:
+    def build_memory_payload(self, message_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Store Discord message as instruction memory via server endpoint
+        Build the instruction payload for a Discord message
         
         Args:
             message_data: Complete Discord message data
             
         Returns:
-            Response from server
+            Payload for the instruction endpoint
         """
-        # Use instruction endpoint for Discord messages
-        url = f"{self.base_url}/api/memory/instruction"
-        
         # Prepare the content for extraction
         content = message_data["content"]
         
         # Include thread context if available
-        if message_data.get("context", {}).get("thread_messages"):
-            thread_context = "\n".join([
+        thread_messages = message_data.get("context", {}).get("thread_messages")
+        if thread_messages:
+            thread_context = "\n".join(
                 f"{m['author_name']}: {m['content']}" 
-                for m in message_data["context"]["thread_messages"][-5:]
-            ])
+                for m in thread_messages[-5:]
+            )
             content = f"Thread context:\n{thread_context}\n\nCurrent message:\n{content}"
         
         # Format as instruction with context
         instruction = f"[Discord #{message_data['channel_name']}] {message_data['author_name']}: {content}"
         
-        payload = {
+        return {
             "instruction": instruction,
             "user_id": f"discord_{message_data['author_id']}",
             "context": {
@@ -101,9 +150,25 @@ class PaladinClient:
                 "author": message_data["author_name"],
                 "timestamp": message_data["timestamp"],
                 "is_thread": message_data.get("is_thread", False),
-                "has_context": bool(message_data.get("context", {}).get("thread_messages"))
+                "has_context": bool(thread_messages)
             }
         }
+    
+    async def extract_and_store_memory(self, message_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store Discord message as instruction memory via server endpoint
+        
+        Args:
+            message_data: Complete Discord message data
+            
+        Returns:
+            Response from server
+        """
+        # Use instruction endpoint for Discord messages
+        url = self.instruction_url
+        
+        payload = self.build_memory_payload(message_data)
+        instruction = payload["instruction"]
         
         print(f"[PALADIN CLIENT] Sending to server: {url}")
         print(f"[PALADIN CLIENT] Instruction: {instruction}")
@@ -112,28 +177,37 @@ class PaladinClient:
         async with aiohttp.ClientSession() as session:
             try:
                 print(f"[PALADIN CLIENT] Making POST request to {url}...")
-                async with session.post(url, json=payload, timeout=self.timeout) as response:
-                    response_text = await response.text()
-                    print(f"[PALADIN CLIENT] Response status: {response.status}")
-                    print(f"[PALADIN CLIENT] Response text: {response_text[:500]}..." if len(response_text) > 500 else f"[PALADIN CLIENT] Response text: {response_text}")
-                    
-                    result = await response.json(content_type=None)
-                    print(f"[PALADIN CLIENT] Parsed response: {result}")
+                status, body = await self._post(session, url, orjson.dumps(payload))
+                print(f"[PALADIN CLIENT] Response status: {status}")
+                
+                try:
+                    result = orjson.loads(body)
+                except orjson.JSONDecodeError:
+                    # Only decode the body as text when it is needed for diagnostics
+                    logger.debug("Response text: %.500s", body.decode("utf-8", errors="replace"))
+                    return {
+                        "success": False,
+                        "error": f"Server returned {status} with a non-JSON body"
+                    }
+                print(f"[PALADIN CLIENT] Parsed response: {result}")
+                
+                if status == 200:
+                    return {
+                        "success": True,
+                        "memory_id": result.get("memory_id"),
+                        "memory_type": result.get("memory_type", "instruction"),
+                        "relationships_count": result.get("relationships_count", 0)
+                    }
+                else:
+                    print(f"[PALADIN CLIENT] Error response: {result}")
+                    return {
+                        "success": False,
+                        "error": f"Server returned {status}: {result.get('detail', 'Unknown error')}"
+                    }
                     
-                    if response.status == 200:
-                        return {
-                            "success": True,
-                            "memory_id": result.get("memory_id"),
-                            "memory_type": result.get("memory_type", "instruction"),
-                            "relationships_count": result.get("relationships_count", 0)
-                        }
-                    else:
-                        print(f"[PALADIN CLIENT] Error response: {result}")
-                        return {
-                            "success": False,
-                            "error": f"Server returned {response.status}: {result.get('detail', 'Unknown error')}"
-                        }
-                        
+            except TransientServerError as e:
+                print(f"[PALADIN CLIENT] Giving up after retries: {e}")
+                return {"success": False, "error": str(e)}
             except asyncio.TimeoutError:
                 return {"success": False, "error": "Request timeout"}
             except Exception as e:
@@ -151,32 +225,34 @@ class PaladinClient:
         Returns:
             Search results from server
         """
-        url = f"{self.base_url}/api/memory/search"
+        url = self.search_url
         
         payload = {
             "query": query,
             "user_id": f"discord_{user_id}" if user_id else None,
             "limit": limit,
-            "memory_types": ["instruction", "extracted", "discord"]
+            "memory_types": SEARCH_MEMORY_TYPES
         }
         
         async with aiohttp.ClientSession() as session:
             try:
-                async with session.post(url, json=payload, timeout=self.timeout) as response:
-                    result = await response.json()
+                status, body = await self._post(session, url, orjson.dumps(payload))
+                result = orjson.loads(body)
+                
+                if status == 200:
+                    return {
+                        "success": True,
+                        "total_results": result.get("total_results", 0),
+                        "memories": result.get("memories", [])
+                    }
+                else:
+                    return {
+                        "success": False,
+                        "error": f"Server returned {status}: {result.get('detail', 'Unknown error')}"
+                    }
                     
-                    if response.status == 200:
-                        return {
-                            "success": True,
-                            "total_results": result.get("total_results", 0),
-                            "memories": result.get("memories", [])
-                        }
-                    else:
-                        return {
-                            "success": False,
-                            "error": f"Server returned {response.status}: {result.get('detail', 'Unknown error')}"
-                        }
-                        
+            except TransientServerError as e:
+                return {"success": False, "error": str(e)}
             except asyncio.TimeoutError:
                 return {"success": False, "error": "Request timeout"}
             except Exception as e:
@@ -1,7 +1,11 @@
 """
 Prompts module for Discord MCP
 """
-from .guardrail_prompts import PALADIN_GUARDRAIL_SYSTEM_PROMPT, PALADIN_KEYWORDS
+from .guardrail_prompts import (
+    PALADIN_GUARDRAIL_SYSTEM_PROMPT,
+    PALADIN_KEYWORDS,
+    PALADIN_KEYWORDS_RE
+)
 from .discord_bot_prompts import (
     ACKNOWLEDGMENT_SYSTEM_PROMPT,
     DISCORD_FORMATTING_SYSTEM_PROMPT,
@@ -12,6 +16,7 @@ from .discord_bot_prompts import (
 __all__ = [
     'PALADIN_GUARDRAIL_SYSTEM_PROMPT', 
     'PALADIN_KEYWORDS',
+    'PALADIN_KEYWORDS_RE',
     'ACKNOWLEDGMENT_SYSTEM_PROMPT',
     'DISCORD_FORMATTING_SYSTEM_PROMPT',
     'get_acknowledgment_user_prompt',
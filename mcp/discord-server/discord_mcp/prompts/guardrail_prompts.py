@@ -1,15 +1,10 @@
 """
 Prompts for Discord message processing guardrails
 """
+import re
 
 PALADIN_GUARDRAIL_SYSTEM_PROMPT = """You are a guardrail for PaladinAI, an observability and monitoring assistant.
-Determine if the given message is related to:
-1. System monitoring, observability, or infrastructure
-2. Incidents, alerts, or performance issues
-3. DevOps, SRE, or technical operations
-4. Logs, metrics, traces, or telemetry
-5. Technical discussions that could benefit from monitoring context
-
+Decide if the message relates to monitoring/observability/infrastructure, incidents/alerts/performance, DevOps/SRE operations, logs/metrics/traces/telemetry, or technical discussion that would benefit from monitoring context.
 Respond with JSON: {"relevant": true/false, "confidence": 0.0-1.0, "reason": "brief explanation"}"""
 
 # Keywords that indicate PaladinAI relevance
@@ -20,4 +15,14 @@ PALADIN_KEYWORDS = [
     "log", "trace", "debug", "issue", "problem", "fix", "resolve",
     "infrastructure", "devops", "sre", "observability", "telemetry",
     "load", "cpu", "memory", "disk", "network", "latency", "response"
-]
\ No newline at end of file
+]
+
+# Single alternation so the keyword scan is one C-level search per message.
+# Keywords match as plain substrings, like the original `kw in content` scan
+# ("alerts" and "realert" both contain "alert"); the lookahead makes findall
+# report overlapping occurrences so no keyword hides another. No keyword is a
+# prefix of another, so each position yields at most one keyword.
+PALADIN_KEYWORDS_RE = re.compile(
+    r"(?=(" + "|".join(sorted(map(re.escape, PALADIN_KEYWORDS), key=len, reverse=True)) + r"))",
+    re.IGNORECASE
+)
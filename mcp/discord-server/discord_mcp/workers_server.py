@@ -4,14 +4,16 @@ RQ Workers for processing Discord messages using PaladinAI server
 Instead of direct memory storage, uses PaladinAI server endpoints
 """
 import os
-import json
+import socket
+import logging
 import asyncio
-from typing import Dict, Any, List
+from typing import Dict, Any, List, NamedTuple
 from pathlib import Path
 from datetime import datetime
 
 from dotenv import load_dotenv
 import openai
+import orjson
 import redis
 from rq import Worker, Queue
 
@@ -21,35 +23,42 @@ load_dotenv(Path(__file__).parent.parent.parent.parent / '.env')
 # Initialize OpenAI for guardrail checks
 openai.api_key = os.getenv("OPENAI_API_KEY")
 
-from .paladin_client import PaladinClient
-from .prompts import PALADIN_GUARDRAIL_SYSTEM_PROMPT, PALADIN_KEYWORDS
+from .paladin_client import PaladinClient, REQUEST_BUDGET_SECONDS
+from .prompts import PALADIN_GUARDRAIL_SYSTEM_PROMPT, PALADIN_KEYWORDS_RE
+
+logger = logging.getLogger(__name__)
+
+class Guardrail(NamedTuple):
+    """Outcome of a guardrail relevance check"""
+    relevant: bool
+    confidence: float
+    reason: str
 
 class MessageProcessor:
     def __init__(self):
         self.paladin_client = PaladinClient()
         
-    def check_paladin_relevance(self, message_data: Dict[str, Any]) -> tuple[bool, float, str]:
+    def check_paladin_relevance(self, message_data: Dict[str, Any]) -> Guardrail:
         """
         Check if message is related to PaladinAI operations using guardrail logic
-        Returns: (is_relevant, confidence_score, reason)
+        Returns: Guardrail(relevant, confidence, reason)
         """
         content = message_data.get("content", "")
         channel = message_data.get("channel_name", "")
         
         print(f"[GUARDRAIL] Checking relevance for message...")
         print(f"[GUARDRAIL] Channel: {channel}")
-        print(f"[GUARDRAIL] Content preview: {content[:100]}...")
-        
-        # Use keywords from prompts module
-        paladin_keywords = PALADIN_KEYWORDS
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Content preview: %s...", content[:100])
         
-        # Check for keywords
-        content_lower = content.lower()
-        found_keywords = [kw for kw in paladin_keywords if kw in content_lower]
+        # Check for keywords with the precompiled matcher from the prompts module
+        found_keywords = list(dict.fromkeys(
+            match.lower() for match in PALADIN_KEYWORDS_RE.findall(content)
+        ))
         keyword_matches = len(found_keywords)
         
         print(f"[GUARDRAIL] Keyword scan found {keyword_matches} matches: {found_keywords}")
-        print(f"[GUARDRAIL] Full content being checked: '{content}'")
+        logger.debug("Full content being checked: '%s'", content)
         
         # Use OpenAI for more sophisticated relevance checking
         try:
@@ -68,13 +77,15 @@ class MessageProcessor:
                     }
                 ],
                 temperature=0.1,
+                top_p=0.1,
+                max_tokens=80,  # The verdict JSON is ~50 tokens
                 response_format={"type": "json_object"}
             )
             
-            result = json.loads(response.choices[0].message.content)
+            result = orjson.loads(response.choices[0].message.content)
             print(f"[GUARDRAIL] OpenAI response: {result}")
             
-            return result["relevant"], result["confidence"], result["reason"]
+            return Guardrail(result["relevant"], result["confidence"], result["reason"])
             
         except Exception as e:
             print(f"[GUARDRAIL ERROR] Failed to use OpenAI, falling back to keyword matching: {e}")
@@ -82,14 +93,14 @@ class MessageProcessor:
             if keyword_matches >= 2:
                 reason = f"Contains {keyword_matches} relevant keywords: {', '.join(found_keywords[:3])}"
                 print(f"[GUARDRAIL] Fallback decision: relevant (confidence: 0.7)")
-                return True, 0.7, reason
+                return Guardrail(True, 0.7, reason)
             elif keyword_matches == 1:
                 reason = f"Contains 1 relevant keyword: {found_keywords[0]}"
                 print(f"[GUARDRAIL] Fallback decision: possibly relevant (confidence: 0.4)")
-                return True, 0.4, reason
+                return Guardrail(True, 0.4, reason)
             else:
                 print(f"[GUARDRAIL] Fallback decision: not relevant (confidence: 0.2)")
-                return False, 0.2, "No relevant keywords found"
+                return Guardrail(False, 0.2, "No relevant keywords found")
 
 def process_message(message_data: Dict[str, Any]):
     """Main function called by RQ worker to process a message"""
@@ -133,18 +144,15 @@ def process_message(message_data: Dict[str, Any]):
         # Store in PaladinAI memory via server
         print("[STEP 2] Sending to PaladinAI server for memory storage...")
         
-        # Run async function in sync context
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
         try:
-            # Extract and store memory
+            # Extract and store memory; wait_for cancels the request on timeout
             print(f"[PALADIN CLIENT] Calling extract_and_store_memory...")
             print(f"[PALADIN CLIENT] Server URL: {processor.paladin_client.base_url}")
             
-            result = loop.run_until_complete(
-                processor.paladin_client.extract_and_store_memory(message_data)
-            )
+            result = asyncio.run(asyncio.wait_for(
+                processor.paladin_client.extract_and_store_memory(message_data),
+                timeout=REQUEST_BUDGET_SECONDS
+            ))
             
             print(f"[PALADIN CLIENT] Server response received: {result}")
             
@@ -187,8 +195,6 @@ def process_message(message_data: Dict[str, Any]):
                 "message_id": message_data["id"],
                 "error": str(e)
             }
-        finally:
-            loop.close()
             
     else:
         print(f"[DECISION] ❌ Message below relevance threshold, skipping")
@@ -203,6 +209,28 @@ def process_message(message_data: Dict[str, Any]):
             "reason": reason
         }
 
+_redis_pool = None
+
+def get_redis_pool() -> redis.ConnectionPool:
+    """Return the process-wide Valkey/Redis connection pool, creating it on first use"""
+    global _redis_pool
+    if _redis_pool is None:
+        keepalive_options = {}
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            keepalive_options[socket.TCP_KEEPIDLE] = 30
+        
+        _redis_pool = redis.ConnectionPool(
+            host=os.getenv("VALKEY_HOST", "localhost"),
+            port=int(os.getenv("VALKEY_PORT", "6379")),
+            password=None,  # No password in current setup
+            db=int(os.getenv("VALKEY_DB", "0")),
+            max_connections=int(os.getenv("VALKEY_MAX_CONNECTIONS", "32")),
+            socket_keepalive=True,
+            socket_keepalive_options=keepalive_options,
+            health_check_interval=30
+        )
+    return _redis_pool
+
 def start_worker():
     """Start the RQ worker"""
     print("\n" + "="*80)
@@ -222,12 +250,7 @@ def start_worker():
     print(f"  - PaladinAI Server: http://{os.getenv('SERVER_HOST', '127.0.0.1')}:{os.getenv('SERVER_PORT', '8000')}")
     print("="*80 + "\n")
     
-    redis_conn = redis.Redis(
-        host=host,
-        port=int(os.getenv("VALKEY_PORT", "6379")),
-        password=None,  # No password in current setup
-        db=int(os.getenv("VALKEY_DB", "0"))
-    )
+    redis_conn = redis.Redis(connection_pool=get_redis_pool())
     
     try:
         # Test Redis connection
@@ -0,0 +1,46 @@
+"""
+Tests for the guardrail keyword matcher
+"""
+import pytest
+
+from discord_mcp.prompts import PALADIN_KEYWORDS, PALADIN_KEYWORDS_RE
+
+
+def scan(content: str) -> set:
+    """Keywords reported by the precompiled matcher, as the worker collects them"""
+    return {match.lower() for match in PALADIN_KEYWORDS_RE.findall(content)}
+
+
+def substring_scan(content: str) -> set:
+    """Reference behaviour: the original `kw in content` scan"""
+    content_lower = content.lower()
+    return {kw for kw in PALADIN_KEYWORDS if kw in content_lower}
+
+
+@pytest.mark.parametrize("content", [
+    "",
+    "hello there, lunch at noon?",
+    "Prometheus alerts firing for CPU on prod",
+    "realerting is broken after the redeploy",
+    "Checked the logs: ERROR in debugging, latency spike",
+    "payload/overloaded servers, disk-pressure; network_issue",
+    "errors and warnings in the system response",
+    "diskcheck",
+])
+def test_matches_original_substring_scan(content):
+    assert scan(content) == substring_scan(content)
+
+
+def test_every_keyword_matches_itself():
+    for keyword in PALADIN_KEYWORDS:
+        assert scan(keyword) == substring_scan(keyword)
+
+
+def test_overlapping_keywords_are_all_reported():
+    # "diskcheck" holds both "disk" and "check"; "overloaded" holds "load"
+    assert {"disk", "check"} <= scan("diskcheck")
+    assert "load" in scan("overloaded")
+
+
+def test_match_is_case_insensitive():
+    assert scan("GRAFANA Dashboard") == {"grafana"}
@@ -0,0 +1,90 @@
+"""
+Tests for the PaladinClient retry policy
+"""
+import asyncio
+from unittest.mock import MagicMock
+
+import aiohttp
+import pytest
+from tenacity import wait_none
+
+from discord_mcp.paladin_client import PaladinClient, TransientServerError
+
+
+class FakeResponse:
+    def __init__(self, status: int, body: bytes = b"{}"):
+        self.status = status
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """Session whose post() replays a script of responses and exceptions"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def post(self, url, data=None, headers=None, timeout=None):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+def connector_error() -> aiohttp.ClientConnectorError:
+    return aiohttp.ClientConnectorError(MagicMock(), OSError("connection refused"))
+
+
+async def post(session: FakeSession):
+    client = PaladinClient()
+    post_now = PaladinClient._post.retry_with(wait=wait_none())
+    return await post_now(client, session, client.instruction_url, b"{}")
+
+
+@pytest.mark.asyncio
+async def test_failed_connect_is_retried():
+    session = FakeSession(connector_error(), connector_error(), FakeResponse(200, b'{"ok": true}'))
+    assert await post(session) == (200, b'{"ok": true}')
+    assert session.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_server_error_is_retried_then_raised():
+    session = FakeSession(*(FakeResponse(503) for _ in range(5)))
+    with pytest.raises(TransientServerError):
+        await post(session)
+    assert session.calls == 5
+
+
+@pytest.mark.asyncio
+async def test_timeout_is_not_retried():
+    # The POST may already have reached the server; retrying would store a duplicate
+    session = FakeSession(asyncio.TimeoutError(), FakeResponse(200))
+    with pytest.raises(asyncio.TimeoutError):
+        await post(session)
+    assert session.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_dropped_connection_is_not_retried():
+    session = FakeSession(aiohttp.ServerDisconnectedError(), FakeResponse(200))
+    with pytest.raises(aiohttp.ServerDisconnectedError):
+        await post(session)
+    assert session.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_client_error_is_returned_without_retry():
+    session = FakeSession(FakeResponse(422, b'{"detail": "bad"}'))
+    assert await post(session) == (422, b'{"detail": "bad"}')
+    assert session.calls == 1
@@ -0,0 +1,59 @@
+"""
+Tests for the RQ message processing job
+"""
+import asyncio
+from unittest.mock import patch
+
+from discord_mcp import workers_server
+from discord_mcp.paladin_client import PaladinClient
+from discord_mcp.workers_server import Guardrail, MessageProcessor, process_message
+
+MESSAGE = {
+    "id": "1",
+    "author_id": "42",
+    "author_name": "oncall",
+    "channel_id": "7",
+    "channel_name": "alerts",
+    "content": "disk usage alert on db-1",
+    "timestamp": "2025-01-01T00:00:00Z",
+}
+
+
+def test_irrelevant_message_skips_payload_build():
+    with patch.object(MessageProcessor, "check_paladin_relevance",
+                      return_value=Guardrail(False, 0.2, "No relevant keywords found")), \
+         patch.object(PaladinClient, "build_memory_payload") as build:
+        result = process_message(MESSAGE)
+    assert result["status"] == "skipped"
+    build.assert_not_called()
+
+
+def test_relevant_message_is_stored():
+    async def store(self, message_data):
+        return {"success": True, "memory_id": "m1", "memory_type": "instruction"}
+
+    with patch.object(MessageProcessor, "check_paladin_relevance",
+                      return_value=Guardrail(True, 0.9, "alerting")), \
+         patch.object(PaladinClient, "extract_and_store_memory", store):
+        result = process_message(MESSAGE)
+    assert result["status"] == "processed"
+    assert result["server_response"]["memory_id"] == "m1"
+
+
+def test_store_timeout_is_reported():
+    cancelled = []
+
+    async def stall(self, message_data):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    with patch.object(MessageProcessor, "check_paladin_relevance",
+                      return_value=Guardrail(True, 0.9, "alerting")), \
+         patch.object(PaladinClient, "extract_and_store_memory", stall), \
+         patch.object(workers_server, "REQUEST_BUDGET_SECONDS", 0.05):
+        result = process_message(MESSAGE)
+    assert result["status"] == "error"
+    assert cancelled == [True]
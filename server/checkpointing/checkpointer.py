@@ -5,19 +5,202 @@ This module provides MongoDB-based checkpointing functionality for
 saving and restoring workflow state across executions.
 """
 
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+import weakref
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, AsyncIterator
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
 
+import zstandard
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
 from langgraph.checkpoint.mongodb import AsyncMongoDBSaver
-from motor.motor_asyncio import AsyncIOMotorClient
+from langgraph.checkpoint.mongodb.utils import loads_metadata
+from pymongo import AsyncMongoClient, ReadPreference
+from pymongo.asynchronous.collection import AsyncCollection
 from pymongo.errors import ConnectionFailure, OperationFailure
 
 from .config import checkpoint_config
 
 logger = logging.getLogger(__name__)
 
+# Async MongoDB clients shared across checkpointer instances, keyed by event
+# loop and then by (mongodb_uri, database_name), with a reference count per key
+# so a re-initialized checkpointer reuses the existing connection pool. Clients
+# are bound to the loop that first uses them, so loops never share one. The
+# loop object itself is the key because id(loop) is reused once a loop is
+# garbage-collected.
+_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple[str, str], AsyncMongoClient]]" = \
+    weakref.WeakKeyDictionary()
+_CLIENT_REFS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple[str, str], int]]" = \
+    weakref.WeakKeyDictionary()
+
+
+def _acquire_client(
+    loop: asyncio.AbstractEventLoop,
+    key: tuple[str, str],
+    **client_kwargs: Any
+) -> AsyncMongoClient:
+    """Return the shared client for key on loop, creating it on first use."""
+    clients = _CLIENTS.setdefault(loop, {})
+    refs = _CLIENT_REFS.setdefault(loop, {})
+    client = clients.get(key)
+    if client is None:
+        client = AsyncMongoClient(key[0], **client_kwargs)
+        clients[key] = client
+        refs[key] = 0
+    refs[key] += 1
+    return client
+
+
+def _release_client(loop: asyncio.AbstractEventLoop, key: tuple[str, str]) -> Optional[AsyncMongoClient]:
+    """
+    Drop one reference to the shared client.
+    
+    Returns:
+        The client once its last reference is released (for the caller to
+        close), None while other references remain
+    """
+    clients = _CLIENTS.get(loop, {})
+    if key not in clients:
+        return None
+    refs = _CLIENT_REFS[loop]
+    refs[key] -= 1
+    if refs[key] > 0:
+        return None
+    del refs[key]
+    return clients.pop(key)
+
+
+@lru_cache(maxsize=2048)
+def _build_config(thread_id: str, checkpoint_ns: str) -> Mapping[str, Any]:
+    """Build the read-only checkpoint config for a thread, memoized per (thread_id, checkpoint_ns)."""
+    return MappingProxyType({
+        "configurable": MappingProxyType({
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns
+        })
+    })
+
+# Index and projection used by load_checkpoint; the index is created in _create_indexes
+_LOAD_INDEX = [("checkpoint_ns", 1), ("thread_id", 1), ("_id", -1)]
+_LOAD_PROJECTION = {"checkpoint": 0}
+
+# Fields returned by list_checkpoints; the document size (including the binary
+# checkpoint payload) is computed server-side so the payload is never transferred
+_LIST_PROJECTION = {
+    "thread_id": 1,
+    "checkpoint_ns": 1,
+    "checkpoint_id": 1,
+    "parent_checkpoint_id": 1,
+    "type": 1,
+    "metadata": 1,
+    "size_bytes": {"$bsonSize": "$$ROOT"}
+}
+
+# Fields returned by iter_checkpoints, which also decodes the checkpoint payload
+_THREAD_LIST_PROJECTION = {**_LIST_PROJECTION, "checkpoint": 1}
+
+
+_RAW_CODEC_OPTIONS = CodecOptions(document_class=RawBSONDocument)
+
+
+def _decode_batch(docs: list[Mapping[str, Any]]) -> list[Dict[str, Any]]:
+    """
+    Convert raw checkpoint documents into checkpoint metadata dictionaries.
+    
+    Args:
+        docs: Checkpoint documents (dicts or RawBSONDocuments) without the
+            binary checkpoint payload
+        
+    Returns:
+        List of checkpoint metadata, skipping documents that fail to decode
+    """
+    checkpoints = []
+    for doc in docs:
+        try:
+            # Extract fields from the document
+            # The checkpoint field is binary msgpack data, we'll extract timestamp from metadata
+            metadata = doc.get("metadata", {})
+            if isinstance(metadata, Mapping):
+                metadata = {
+                    k: v.decode('utf-8', 'replace') if type(v) is bytes else v
+                    for k, v in metadata.items()
+                }
+            
+            # Insertion time as epoch seconds, for cheap expiry comparisons
+            ts_epoch = doc["_id"].generation_time.timestamp() if "_id" in doc else None
+            
+            # Try to get timestamp from metadata or document
+            timestamp = None
+            if "created_at" in metadata:
+                timestamp = metadata["created_at"]
+            elif "ts" in metadata:
+                timestamp = metadata["ts"]
+            elif "_id" in doc:
+                # ObjectId contains timestamp
+                timestamp = doc["_id"].generation_time.isoformat()
+            
+            checkpoints.append({
+                "thread_id": doc.get("thread_id"),
+                "checkpoint_ns": doc.get("checkpoint_ns", ""),
+                "checkpoint_id": doc.get("checkpoint_id"),
+                "timestamp": timestamp,
+                "ts_epoch": ts_epoch,
+                "metadata": metadata,
+                "parent_checkpoint_id": doc.get("parent_checkpoint_id"),
+                "type": doc.get("type", "unknown"),
+                "size_bytes": doc.get("size_bytes")
+            })
+        except Exception as e:
+            logger.warning("Error processing checkpoint document: %s", e)
+            continue
+    return checkpoints
+
+
+class _CompressingSerializer:
+    """
+    Serializer that zstd-compresses large values produced by another serializer.
+    
+    When compression is enabled, serialized values larger than threshold_bytes
+    are compressed and their type is tagged with a "+zstd" suffix, so
+    loads_typed can tell them apart from values stored uncompressed. Tagged
+    values can only be read through this wrapper, not by a plain
+    AsyncMongoDBSaver, which is why compression is opt-in. Decoding always
+    handles both forms, so turning compression off again keeps previously
+    compressed checkpoints readable.
+    """
+    
+    _SUFFIX = "+zstd"
+    
+    def __init__(self, serde: Any, threshold_bytes: int, compress: bool = False, level: int = 3):
+        self._serde = serde
+        self._threshold_bytes = threshold_bytes
+        self._compress = compress
+        self._level = level
+    
+    def dumps(self, obj: Any) -> bytes:
+        return self._serde.dumps(obj)
+    
+    def loads(self, data: bytes) -> Any:
+        return self._serde.loads(data)
+    
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        type_, data = self._serde.dumps_typed(obj)
+        if self._compress and len(data) > self._threshold_bytes:
+            return type_ + self._SUFFIX, zstandard.compress(data, self._level)
+        return type_, data
+    
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_.endswith(self._SUFFIX):
+            return self._serde.loads_typed(
+                (type_[:-len(self._SUFFIX)], zstandard.decompress(payload))
+            )
+        return self._serde.loads_typed(data)
+
 
 class PaladinCheckpointer:
     """
@@ -35,12 +218,30 @@ class PaladinCheckpointer:
         self.collection_name = self.config.collection_name
         self.enabled = self.config.enabled
         self.ttl_days = self.config.checkpoint_ttl_days
+        self.ttl_seconds = self.ttl_days * 24 * 60 * 60
         
-        self._client: Optional[AsyncIOMotorClient] = None
+        self._client: Optional[AsyncMongoClient] = None
+        self._client_key: Optional[tuple[str, str]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._checkpointer: Optional[AsyncMongoDBSaver] = None
         self._checkpointer_context = None
+        self._collection: Optional[AsyncCollection] = None
+        self._read_collection: Optional[AsyncCollection] = None
+        self._raw_collection: Optional[AsyncCollection] = None
+        
+        logger.info("MongoDB checkpointing %s", 'enabled' if self.enabled else 'disabled')
         
-        logger.info(f"MongoDB checkpointing {'enabled' if self.enabled else 'disabled'}")
+        if not self.enabled:
+            self._disable()
+    
+    async def _noop_save(self, *args: Any, **kwargs: Any) -> None:
+        """Stand-in for save_checkpoint while checkpointing is disabled."""
+        return None
+    
+    def _disable(self) -> None:
+        """Disable checkpointing and bind save_checkpoint to the no-op."""
+        self.enabled = False
+        self.save_checkpoint = self._noop_save
     
     async def initialize(self) -> None:
         """
@@ -56,104 +257,170 @@ class PaladinCheckpointer:
         try:
             # Log the connection attempt
             safe_uri = self.mongodb_uri.split('@')[-1] if '@' in self.mongodb_uri else self.mongodb_uri
-            logger.info(f"Attempting to connect to MongoDB at: {safe_uri}")
-            
-            # Create MongoDB client directly first to test connection
-            # Use directConnection=True to bypass replica set hostname issues
-            self._client = AsyncIOMotorClient(
-                self.mongodb_uri,
-                directConnection=True,
-                serverSelectionTimeoutMS=30000
-            )
+            logger.info("Attempting to connect to MongoDB at: %s", safe_uri)
+            
+            # Reuse the process-wide client for this URI and database.
+            # Topology (replicaSet, readPreference, directConnection) comes
+            # from MONGODB_URI so the driver can spread work across members.
+            if self._client is None:
+                self._loop = asyncio.get_running_loop()
+                self._client_key = (self.mongodb_uri, self.database_name)
+                self._client = _acquire_client(
+                    self._loop,
+                    self._client_key,
+                    serverSelectionTimeoutMS=30000,
+                    maxPoolSize=self.config.max_pool_size,
+                    minPoolSize=self.config.min_pool_size,
+                    maxIdleTimeMS=self.config.max_idle_time_ms,
+                    maxConnecting=self.config.max_connecting,
+                    waitQueueTimeoutMS=self.config.wait_queue_timeout_ms
+                )
             
             # Test the connection
             await self._client.admin.command('ping')
             logger.info("Successfully connected to MongoDB")
             
+            # Warm up the pool with concurrent pings so the first checkpoint
+            # operations don't pay connection setup and auth
+            if self.config.min_pool_size > 1:
+                await asyncio.gather(*(
+                    self._client.admin.command('ping')
+                    for _ in range(self.config.min_pool_size)
+                ))
+            
             # Create checkpointer with the client
+            # With ttl set, the saver stamps every document with a BSON
+            # created_at date that the TTL indexes below expire server-side
             self._checkpointer = AsyncMongoDBSaver(
                 client=self._client,
-                db_name=self.database_name
+                db_name=self.database_name,
+                ttl=self.ttl_seconds
+            )
+            
+            # Optionally compress large checkpoints and writes (e.g. verbatim
+            # tool output) before they are stored. The wrapper is installed
+            # either way so compressed documents from earlier runs stay readable.
+            self._checkpointer.serde = _CompressingSerializer(
+                self._checkpointer.serde,
+                self.config.compress_threshold_kb * 1024,
+                compress=self.config.compress_enabled
             )
             
-            logger.info(f"AsyncMongoDBSaver initialized for database '{self.database_name}'")
+            logger.info("AsyncMongoDBSaver initialized for database '%s'", self.database_name)
+            
+            # Cache the checkpoint collection handles used by the direct queries;
+            # the raw variant reads documents as RawBSONDocument so BSON decoding
+            # is deferred until a field is read
+            self._collection = self._checkpointer.checkpoint_collection
+            # Reads tolerate slightly stale data, so they may be served by
+            # secondaries; writes and deletes stay on the primary
+            self._read_collection = self._collection.with_options(
+                read_preference=ReadPreference.SECONDARY_PREFERRED
+            )
+            self._raw_collection = self._read_collection.with_options(codec_options=_RAW_CODEC_OPTIONS)
             
             # Create indexes for better performance
             await self._create_indexes()
             
         except ConnectionFailure as e:
-            logger.error(f"Failed to connect to MongoDB: {str(e)}")
-            self.enabled = False
+            logger.error("Failed to connect to MongoDB: %s", e)
+            self._disable()
             raise
         except Exception as e:
-            logger.error(f"Failed to initialize checkpointer: {str(e)}")
-            self.enabled = False
+            logger.error("Failed to initialize checkpointer: %s", e)
+            self._disable()
             raise
     
     async def _ensure_database_exists(self) -> None:
         """Ensure the database and collection exist in MongoDB."""
         try:
-            # List existing databases
-            db_names = await self._client.list_database_names()
-            logger.debug(f"Existing databases: {db_names}")
-            
-            # Access the database (creates it if it doesn't exist)
+            # Access the database (created together with its first collection)
             db = self._client[self.database_name]
             
-            # Check if collection exists
-            collection_names = await db.list_collection_names()
-            logger.debug(f"Existing collections in {self.database_name}: {collection_names}")
+            # Check for the collection with a single filtered round trip
+            collection_names = await db.list_collection_names(filter={"name": self.collection_name})
             
-            if self.collection_name not in collection_names:
+            if not collection_names:
                 # Create the collection explicitly
                 await db.create_collection(self.collection_name)
-                logger.info(f"Created collection '{self.collection_name}' in database '{self.database_name}'")
+                logger.info("Created collection '%s' in database '%s'", self.collection_name, self.database_name)
             else:
-                logger.info(f"Collection '{self.collection_name}' already exists in database '{self.database_name}'")
-                
-            # Insert a test document to ensure database is created
-            test_collection = db["_checkpoint_init"]
-            await test_collection.insert_one({"initialized": True, "timestamp": datetime.now(timezone.utc)})
-            await test_collection.delete_many({})  # Clean up test collection
+                logger.info("Collection '%s' already exists in database '%s'", self.collection_name, self.database_name)
             
         except Exception as e:
-            logger.error(f"Failed to ensure database exists: {str(e)}")
+            logger.error("Failed to ensure database exists: %s", e)
             raise
     
     async def _create_indexes(self) -> None:
         """Create MongoDB indexes for optimal checkpoint queries."""
         try:
-            # Access the client from the checkpointer
-            if hasattr(self._checkpointer, 'client'):
-                client = self._checkpointer.client
-            elif hasattr(self._checkpointer, '_client'):
-                client = self._checkpointer._client
-            else:
-                logger.warning("Could not access MongoDB client from checkpointer for index creation")
-                return
-                
-            db = client[self.database_name]
-            collection = db[self.collection_name]
-            
-            # Create compound index for thread_id and timestamp
-            await collection.create_index([
-                ("thread_id", 1),
-                ("timestamp", -1)
-            ])
-            
-            # Create index for checkpoint_ns
-            await collection.create_index("checkpoint_ns")
-            
-            # Create TTL index for automatic cleanup
-            await collection.create_index(
-                "timestamp",
-                expireAfterSeconds=self.ttl_days * 24 * 60 * 60
+            # Compound indexes on the LangGraph checkpoint collection, ordered
+            # Equality -> Sort so the hot queries never sort in memory:
+            # load_checkpoint filters {checkpoint_ns, thread_id} sorted by _id desc.
+            checkpoints = self._checkpointer.checkpoint_collection
+            writes = self._checkpointer.writes_collection
+            # The indexes are independent, so build them concurrently
+            await asyncio.gather(
+                # Unique indexes the saver relies on for its upserts. The saver
+                # only creates them while a collection has fewer than two
+                # indexes, which is no longer true once ours exist. Same keys
+                # and default names as the saver, so creation is idempotent.
+                checkpoints.create_index(
+                    [("thread_id", 1), ("checkpoint_ns", 1), ("checkpoint_id", -1)],
+                    unique=True
+                ),
+                writes.create_index(
+                    [
+                        ("thread_id", 1),
+                        ("checkpoint_ns", 1),
+                        ("checkpoint_id", -1),
+                        ("task_id", 1),
+                        ("idx", 1)
+                    ],
+                    unique=True
+                ),
+                checkpoints.create_index(_LOAD_INDEX, name="ns_thread_id"),
+                # list_checkpoints filters {checkpoint_ns} sorted by _id desc
+                checkpoints.create_index([
+                    ("checkpoint_ns", 1),
+                    ("_id", -1)
+                ], name="ns_id"),
+                # TTL indexes so MongoDB expires old checkpoints and writes itself;
+                # this is the only expiry path, there is no application-side sweep.
+                # The saver only adds these on a fresh collection, so ensure them here.
+                *(
+                    ttl_collection.create_index(
+                        "created_at",
+                        expireAfterSeconds=self.ttl_seconds
+                    )
+                    for ttl_collection in (checkpoints, writes)
+                )
             )
             
             logger.info("Created MongoDB indexes for checkpointing")
             
+            if logger.isEnabledFor(logging.DEBUG):
+                await self._explain_load_query(checkpoints)
+            
+        except Exception as e:
+            logger.warning("Failed to create indexes: %s", e)
+    
+    async def _explain_load_query(self, collection: AsyncCollection) -> None:
+        """Log how the load_checkpoint query uses its index (debug aid)."""
+        try:
+            plan = await collection.find(
+                {"checkpoint_ns": "", "thread_id": ""},
+                projection=_LOAD_PROJECTION
+            ).sort("_id", -1).hint(_LOAD_INDEX).limit(1).explain()
+            stats = plan.get("executionStats", {})
+            logger.debug(
+                "load_checkpoint plan: totalKeysExamined=%s totalDocsExamined=%s nReturned=%s",
+                stats.get("totalKeysExamined"),
+                stats.get("totalDocsExamined"),
+                stats.get("nReturned")
+            )
         except Exception as e:
-            logger.warning(f"Failed to create indexes: {str(e)}")
+            logger.debug("Could not explain load_checkpoint query: %s", e)
     
     @property
     def checkpointer(self) -> Optional[AsyncMongoDBSaver]:
@@ -165,23 +432,21 @@ class PaladinCheckpointer:
         """
         return self._checkpointer if self.enabled else None
     
-    def get_config(self, thread_id: str, checkpoint_ns: str = "") -> Dict[str, Any]:
+    def get_config(self, thread_id: str, checkpoint_ns: str = "") -> Mapping[str, Any]:
         """
-        Create a checkpoint configuration.
+        Get the checkpoint configuration for a thread.
+        
+        Configs are memoized per (thread_id, checkpoint_ns) and returned as
+        read-only mappings, since callers only pass them through to LangGraph.
         
         Args:
             thread_id: Unique identifier for the conversation thread
             checkpoint_ns: Namespace for checkpoint organization
             
         Returns:
-            Configuration dictionary for checkpointing
+            Read-only configuration mapping for checkpointing
         """
-        return {
-            "configurable": {
-                "thread_id": thread_id,
-                "checkpoint_ns": checkpoint_ns
-            }
-        }
+        return _build_config(thread_id, checkpoint_ns)
     
     async def save_checkpoint(
         self,
@@ -210,10 +475,10 @@ class PaladinCheckpointer:
                 metadata=metadata or {},
                 new_versions={}
             )
-            logger.debug(f"Saved checkpoint for thread {thread_id}")
+            logger.debug("Saved checkpoint for thread %s", thread_id)
             
         except Exception as e:
-            logger.error(f"Failed to save checkpoint: {str(e)}")
+            logger.error("Failed to save checkpoint: %s", e)
             # Don't fail the workflow if checkpointing fails
     
     async def load_checkpoint(
@@ -236,17 +501,24 @@ class PaladinCheckpointer:
         
         try:
             # Query MongoDB directly since LangGraph's aget might have issues
-            db = self._client[self.database_name]
-            collection = db['checkpoints_aio']
-            
-            # Find the latest checkpoint for this thread
-            doc = await collection.find_one(
-                {'thread_id': thread_id, 'checkpoint_ns': checkpoint_ns},
-                sort=[('_id', -1)]
-            )
+            collection = self._read_collection
+            
+            # Find the latest checkpoint for this thread, pinned to the
+            # (checkpoint_ns, thread_id, _id) index and without the binary payload
+            query = {'checkpoint_ns': checkpoint_ns, 'thread_id': thread_id}
+            try:
+                doc = await collection.find_one(
+                    query,
+                    projection=_LOAD_PROJECTION,
+                    sort=[('_id', -1)],
+                    hint=_LOAD_INDEX
+                )
+            except OperationFailure:
+                # The hinted index is missing (e.g. index creation failed at startup)
+                doc = await collection.find_one(query, projection=_LOAD_PROJECTION, sort=[('_id', -1)])
             
             if doc:
-                logger.debug(f"Loaded checkpoint for thread {thread_id}")
+                logger.debug("Loaded checkpoint for thread %s", thread_id)
                 
                 # Extract timestamp from ObjectId
                 timestamp = doc["_id"].generation_time.isoformat() if "_id" in doc else None
@@ -254,17 +526,11 @@ class PaladinCheckpointer:
                 # Extract metadata - handle if it's binary
                 metadata = doc.get("metadata", {})
                 if isinstance(metadata, dict):
-                    # Convert any bytes values to strings in metadata
-                    cleaned_metadata = {}
-                    for k, v in metadata.items():
-                        if isinstance(v, bytes):
-                            try:
-                                cleaned_metadata[k] = v.decode('utf-8')
-                            except:
-                                cleaned_metadata[k] = "<binary data>"
-                        else:
-                            cleaned_metadata[k] = v
-                    metadata = cleaned_metadata
+                    # Convert any bytes values to strings in metadata in a single pass
+                    metadata = {
+                        k: v.decode('utf-8', 'replace') if type(v) is bytes else v
+                        for k, v in metadata.items()
+                    }
                 
                 return {
                     "thread_id": doc.get("thread_id", thread_id),
@@ -277,13 +543,45 @@ class PaladinCheckpointer:
                     # Don't include raw binary checkpoint data
                 }
             
-            logger.info(f"No checkpoint found for thread {thread_id} with ns '{checkpoint_ns}'")
+            logger.info("No checkpoint found for thread %s with ns '%s'", thread_id, checkpoint_ns)
             return None
             
         except Exception as e:
-            logger.error(f"Failed to load checkpoint: {str(e)}")
+            logger.error("Failed to load checkpoint: %s", e)
             return None
     
+    async def checkpoint_exists(
+        self,
+        thread_id: str,
+        checkpoint_ns: str = ""
+    ) -> bool:
+        """
+        Check whether any checkpoint exists for a thread.
+        
+        Counts at most one matching document on the (checkpoint_ns, thread_id)
+        index, so no checkpoint data is fetched or decoded.
+        
+        Args:
+            thread_id: Thread identifier
+            checkpoint_ns: Namespace for organization
+        
+        Returns:
+            True if a checkpoint exists, False otherwise
+        """
+        if not self.enabled or not self._checkpointer:
+            return False
+        
+        try:
+            count = await self._read_collection.count_documents(
+                {'checkpoint_ns': checkpoint_ns, 'thread_id': thread_id},
+                limit=1
+            )
+            return count > 0
+        
+        except Exception as e:
+            logger.error("Failed to check checkpoint existence: %s", e)
+            return False
+    
     async def list_checkpoints(
         self,
         thread_id: Optional[str] = None,
@@ -309,167 +607,156 @@ class PaladinCheckpointer:
             # because LangGraph's alist doesn't support listing all threads
             if not thread_id:
                 # Access MongoDB directly to list all checkpoints
-                db = self._client[self.database_name]
-                collection = db['checkpoints_aio']  # LangGraph uses this collection
+                collection = self._raw_collection
                 
                 # Build query - by default get all checkpoints with empty namespace
                 query = {'checkpoint_ns': ''}  # Most checkpoints use empty namespace
                 
-                logger.info(f"Querying MongoDB directly with query: {query}, limit: {limit}")
+                logger.info("Querying MongoDB directly with query: %s, limit: %s", query, limit)
                 
-                checkpoints = []
-                cursor = collection.find(query).sort('_id', -1).limit(limit)
-                async for doc in cursor:
-                    try:
-                        # Extract fields from the document
-                        # The checkpoint field is binary msgpack data, we'll extract timestamp from metadata
-                        metadata = doc.get("metadata", {})
-                        
-                        # Try to get timestamp from metadata or document
-                        timestamp = None
-                        if "created_at" in metadata:
-                            timestamp = metadata["created_at"]
-                        elif "ts" in metadata:
-                            timestamp = metadata["ts"]
-                        elif "_id" in doc:
-                            # ObjectId contains timestamp
-                            timestamp = doc["_id"].generation_time.isoformat()
-                        
-                        checkpoint_dict = {
-                            "thread_id": doc.get("thread_id"),
-                            "checkpoint_ns": doc.get("checkpoint_ns", ""),
-                            "checkpoint_id": doc.get("checkpoint_id"),
-                            "timestamp": timestamp,
-                            "metadata": metadata,
-                            "parent_checkpoint_id": doc.get("parent_checkpoint_id"),
-                            "type": doc.get("type", "unknown")
-                        }
-                        checkpoints.append(checkpoint_dict)
-                    except Exception as e:
-                        logger.warning(f"Error processing checkpoint document: {str(e)}")
-                        continue
+                # Exclude the binary msgpack checkpoint payload; only metadata fields
+                # and its server-computed size are returned, and the whole page is
+                # fetched in one batch instead of iterating the cursor
+                docs = await collection.find(query, projection=_LIST_PROJECTION).sort('_id', -1) \
+                    .limit(limit).batch_size(limit).to_list(length=limit)
+                
+                checkpoints = _decode_batch(docs)
                 
-                logger.info(f"Found {len(checkpoints)} checkpoints from MongoDB")
+                logger.info("Found %s checkpoints from MongoDB", len(checkpoints))
                 return checkpoints
             
-            # For specific thread_id, use LangGraph's alist
-            config = self.get_config(thread_id, checkpoint_ns)
-            logger.info(f"Listing checkpoints for thread {thread_id} with config: {config}, limit: {limit}")
-            
-            checkpoints = []
-            async for checkpoint_tuple in self._checkpointer.alist(config, limit=limit):
-                # Convert CheckpointTuple to dictionary
-                checkpoint_dict = {
-                    "config": checkpoint_tuple.config,
-                    "checkpoint": checkpoint_tuple.checkpoint,
-                    "metadata": checkpoint_tuple.metadata,
-                    "parent_config": checkpoint_tuple.parent_config,
-                    "thread_id": checkpoint_tuple.config.get("configurable", {}).get("thread_id"),
-                    "checkpoint_ns": checkpoint_tuple.config.get("configurable", {}).get("checkpoint_ns", ""),
-                    "checkpoint_id": checkpoint_tuple.checkpoint.id if checkpoint_tuple.checkpoint else None,
-                    "timestamp": checkpoint_tuple.checkpoint.ts if checkpoint_tuple.checkpoint else None
-                }
-                checkpoints.append(checkpoint_dict)
+            # For a specific thread_id, collect the streamed checkpoints
+            checkpoints = [
+                checkpoint
+                async for checkpoint in self.iter_checkpoints(thread_id, checkpoint_ns, limit)
+            ]
             
-            logger.info(f"Found {len(checkpoints)} checkpoints")
+            logger.info("Found %s checkpoints", len(checkpoints))
             return checkpoints
             
         except Exception as e:
-            logger.error(f"Failed to list checkpoints: {str(e)}")
+            logger.error("Failed to list checkpoints: %s", e)
             return []
     
-    async def delete_checkpoint(
+    async def iter_checkpoints(
         self,
         thread_id: str,
-        checkpoint_ns: str = ""
-    ) -> bool:
+        checkpoint_ns: str = "",
+        limit: int = 10
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Delete all checkpoints for a thread.
+        Stream checkpoints for a thread, newest first.
+        
+        Yields the same checkpoint dictionaries that AsyncMongoDBSaver.alist
+        produced for list_checkpoints, read from a single cursor so only one
+        batch is held at a time and no pending writes are fetched per checkpoint.
         
         Args:
             thread_id: Thread identifier
-            checkpoint_ns: Namespace for organization
+            checkpoint_ns: Namespace to filter by
+            limit: Maximum number of checkpoints to yield
             
-        Returns:
-            True if deletion successful, False otherwise
+        Yields:
+            Checkpoint data with its config, metadata and parent config
         """
         if not self.enabled or not self._checkpointer:
-            return False
+            return
+        
+        cursor = self._read_collection.find(
+            {'checkpoint_ns': checkpoint_ns, 'thread_id': thread_id},
+            projection=_THREAD_LIST_PROJECTION,
+            sort=[('_id', -1)],
+            limit=limit
+        )
+        logger.info("Listing checkpoints for thread %s with ns '%s', limit: %s", thread_id, checkpoint_ns, limit)
         
         try:
-            # Access the client from the checkpointer
-            if hasattr(self._checkpointer, 'client'):
-                client = self._checkpointer.client
-            elif hasattr(self._checkpointer, '_client'):
-                client = self._checkpointer._client
-            else:
-                logger.warning("Could not access MongoDB client from checkpointer for deletion")
-                return False
-                
-            db = client[self.database_name]
-            collection = db[self.collection_name]
-            
-            # Delete all checkpoints for the thread
-            result = await collection.delete_many({
-                "thread_id": thread_id,
-                "checkpoint_ns": checkpoint_ns
-            })
-            
-            logger.info(f"Deleted {result.deleted_count} checkpoints for thread {thread_id}")
-            return result.deleted_count > 0
-            
+            async for doc in cursor:
+                checkpoint = self._checkpointer.serde.loads_typed((doc["type"], doc["checkpoint"]))
+                parent_checkpoint_id = doc.get("parent_checkpoint_id")
+                yield {
+                    "config": {
+                        "configurable": {
+                            "thread_id": doc["thread_id"],
+                            "checkpoint_ns": doc["checkpoint_ns"],
+                            "checkpoint_id": doc["checkpoint_id"]
+                        }
+                    },
+                    "checkpoint": checkpoint,
+                    "metadata": loads_metadata(doc["metadata"]),
+                    "parent_config": {
+                        "configurable": {
+                            "thread_id": doc["thread_id"],
+                            "checkpoint_ns": doc["checkpoint_ns"],
+                            "checkpoint_id": parent_checkpoint_id
+                        }
+                    } if parent_checkpoint_id else None,
+                    "thread_id": doc["thread_id"],
+                    "checkpoint_ns": doc["checkpoint_ns"],
+                    "checkpoint_id": doc["checkpoint_id"],
+                    "timestamp": checkpoint.get("ts"),
+                    "size_bytes": doc.get("size_bytes")
+                }
         except Exception as e:
-            logger.error(f"Failed to delete checkpoints: {str(e)}")
-            return False
+            logger.error("Failed to iterate checkpoints: %s", e)
+        finally:
+            await cursor.close()
     
-    async def cleanup_old_checkpoints(self, days: int = 30) -> int:
+    async def delete_checkpoint(
+        self,
+        thread_id: str,
+        checkpoint_ns: str = ""
+    ) -> bool:
         """
-        Clean up checkpoints older than specified days.
+        Delete all checkpoints for a thread.
         
         Args:
-            days: Number of days to keep checkpoints
+            thread_id: Thread identifier
+            checkpoint_ns: Namespace for organization
             
         Returns:
-            Number of checkpoints deleted
+            True if deletion successful, False otherwise
         """
         if not self.enabled or not self._checkpointer:
-            return 0
+            return False
         
         try:
-            from datetime import datetime, timedelta, timezone
-            
-            # Access the client from the checkpointer
-            if hasattr(self._checkpointer, 'client'):
-                client = self._checkpointer.client
-            elif hasattr(self._checkpointer, '_client'):
-                client = self._checkpointer._client
-            else:
-                logger.warning("Could not access MongoDB client from checkpointer for cleanup")
-                return 0
-                
-            db = client[self.database_name]
-            collection = db[self.collection_name]
+            collection = self._collection
+            query = {
+                "checkpoint_ns": checkpoint_ns,
+                "thread_id": thread_id
+            }
             
-            # Calculate cutoff date
-            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+            # Delete all checkpoints for the thread in one round trip
+            result = await collection.delete_many(query)
             
-            # Delete old checkpoints
-            result = await collection.delete_many({
-                "timestamp": {"$lt": cutoff_date}
-            })
-            
-            logger.info(f"Cleaned up {result.deleted_count} old checkpoints")
-            return result.deleted_count
+            logger.info("Deleted %s checkpoints for thread %s", result.deleted_count, thread_id)
+            return result.deleted_count > 0
             
         except Exception as e:
-            logger.error(f"Failed to clean up old checkpoints: {str(e)}")
-            return 0
+            logger.error("Failed to delete checkpoints: %s", e)
+            return False
     
     async def close(self) -> None:
         """Close MongoDB connection."""
         if self._client:
-            self._client.close()
-            logger.info("Closed MongoDB checkpointer connection")
+            self._client = None
+            client = _release_client(self._loop, self._client_key)
+            if client is not None:
+                # Closing can block on outstanding operations; don't let it stall shutdown
+                try:
+                    await asyncio.wait_for(
+                        asyncio.shield(client.close()),
+                        timeout=2.0
+                    )
+                    logger.info("Closed MongoDB checkpointer connection")
+                except asyncio.TimeoutError:
+                    logger.warning("MongoDB checkpointer connection still closing in the background")
+    
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Event loop the MongoDB client is bound to, None before initialization."""
+        return self._loop
     
     @asynccontextmanager
     async def session(self):
@@ -485,30 +772,64 @@ class PaladinCheckpointer:
             await self.close()
 
 
-# Global checkpointer instance
-_checkpointer: Optional[PaladinCheckpointer] = None
+# One checkpointer per event loop, keyed by the loop itself (ids are reused
+# after a loop is collected), so every loop gets a MongoDB client bound to itself
+_checkpointers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, PaladinCheckpointer]" = \
+    weakref.WeakKeyDictionary()
+_init_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = \
+    weakref.WeakKeyDictionary()
+
+
+def _evict_closed_loops() -> None:
+    """
+    Forget checkpointers and clients of closed event loops.
+    
+    Their clients can no longer run or be closed, and entries whose values
+    still reference the loop would otherwise never leave the weak registries.
+    """
+    for loop in [loop for loop in _checkpointers if loop.is_closed()]:
+        del _checkpointers[loop]
+        _init_locks.pop(loop, None)
+    for loop in [loop for loop in _CLIENTS if loop.is_closed()]:
+        del _CLIENTS[loop]
+        _CLIENT_REFS.pop(loop, None)
 
 
 async def get_checkpointer() -> PaladinCheckpointer:
     """
-    Get or create the global checkpointer instance.
+    Get or create the checkpointer instance for the running event loop.
     
     Returns:
         PaladinCheckpointer instance
     """
-    global _checkpointer
+    loop = asyncio.get_running_loop()
     
-    if _checkpointer is None:
-        _checkpointer = PaladinCheckpointer()
-        await _checkpointer.initialize()
+    checkpointer = _checkpointers.get(loop)
+    if checkpointer is None:
+        _evict_closed_loops()
+        async with _init_locks.setdefault(loop, asyncio.Lock()):
+            # Another caller may have finished initialization while we waited
+            checkpointer = _checkpointers.get(loop)
+            if checkpointer is None:
+                checkpointer = PaladinCheckpointer()
+                _checkpointers[loop] = checkpointer
+                await checkpointer.initialize()
     
-    return _checkpointer
+    return checkpointer
 
 
 async def close_checkpointer() -> None:
-    """Close the global checkpointer instance."""
-    global _checkpointer
-    
-    if _checkpointer:
-        await _checkpointer.close()
-        _checkpointer = None
\ No newline at end of file
+    """Close the checkpointer instances of all event loops."""
+    current_loop = asyncio.get_running_loop()
+    for loop, checkpointer in list(_checkpointers.items()):
+        if checkpointer.loop is None or loop is current_loop:
+            await checkpointer.close()
+        elif loop.is_running():
+            # Close on the loop the client is bound to
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(checkpointer.close(), loop)
+            )
+        else:
+            logger.warning("Skipping checkpointer of stopped event loop %s", loop)
+        del _checkpointers[loop]
+        _init_locks.pop(loop, None)
@@ -44,6 +44,37 @@ class CheckpointConfig(BaseModel):
         default=16,
         description="Maximum size of a single checkpoint in MB"
     )
+    # Connection pool settings. The client is async, so a handful of sockets serve
+    # many concurrent checkpoint operations; the sync PyMongo default of 100
+    # mostly leaves idle connections holding server memory.
+    max_pool_size: int = Field(
+        default=20,
+        description="Maximum number of connections in the MongoDB pool"
+    )
+    min_pool_size: int = Field(
+        default=4,
+        description="Minimum number of connections kept open (and warmed up at startup) in the MongoDB pool"
+    )
+    max_idle_time_ms: int = Field(
+        default=90_000,
+        description="Time an idle pooled connection is kept before being closed"
+    )
+    max_connecting: int = Field(
+        default=3,
+        description="Maximum number of connections being established concurrently"
+    )
+    wait_queue_timeout_ms: int = Field(
+        default=5000,
+        description="Time to wait for a free pooled connection before failing"
+    )
+    compress_enabled: bool = Field(
+        default=False,
+        description="Store large checkpoints and writes zstd-compressed; such documents can only be read back through PaladinCheckpointer, not a plain AsyncMongoDBSaver"
+    )
+    compress_threshold_kb: int = Field(
+        default=256,
+        description="With compression enabled, serialized checkpoints and writes larger than this are stored zstd-compressed"
+    )
     
     @classmethod
     def from_env(cls) -> "CheckpointConfig":
@@ -70,7 +101,14 @@ class CheckpointConfig(BaseModel):
             collection_name=os.getenv("MONGODB_COLLECTION", cls.model_fields["collection_name"].default),
             enabled=os.getenv("MONGODB_CHECKPOINT_ENABLED", "true").lower() == "true",
             checkpoint_ttl_days=int(os.getenv("CHECKPOINT_TTL_DAYS", "30")),
-            max_checkpoint_size_mb=int(os.getenv("MAX_CHECKPOINT_SIZE_MB", "16"))
+            max_checkpoint_size_mb=int(os.getenv("MAX_CHECKPOINT_SIZE_MB", "16")),
+            max_pool_size=int(os.getenv("MONGODB_MAX_POOL_SIZE", "20")),
+            min_pool_size=int(os.getenv("MONGODB_MIN_POOL_SIZE", "4")),
+            max_idle_time_ms=int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", "90000")),
+            max_connecting=int(os.getenv("MONGODB_MAX_CONNECTING", "3")),
+            wait_queue_timeout_ms=int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "5000")),
+            compress_enabled=os.getenv("CHECKPOINT_COMPRESS_ENABLED", "false").lower() == "true",
+            compress_threshold_kb=int(os.getenv("CHECKPOINT_COMPRESS_THRESHOLD_KB", "256"))
         )
 
 
@@ -106,10 +106,10 @@ async def check_checkpoint_exists(session_id: str) -> Dict[str, Any]:
     _ensure_workflow()
     
     try:
-        checkpoint = await _workflow.get_checkpoint(session_id)
+        exists = await _workflow.checkpoint_exists(session_id)
         
         return {
-            "exists": checkpoint is not None,
+            "exists": exists,
             "session_id": session_id
         }
         
@@ -145,18 +145,25 @@ async def list_checkpoints(
     _ensure_workflow()
     
     try:
-        checkpoints = await _workflow.list_checkpoints(
-            session_id=session_id,
-            limit=limit
-        )
-        
-        # Format each checkpoint for display
-        formatted_checkpoints = [format_checkpoint_info(cp) for cp in checkpoints]
+        # Listed checkpoints carry their server-computed BSON size, so formatting
+        # is cheap dict work and runs inline rather than in an executor
+        if session_id:
+            # Format each checkpoint as it is streamed so only the formatted
+            # summaries are kept
+            formatted_checkpoints = [
+                format_checkpoint_info(cp)
+                async for cp in _workflow.iter_checkpoints(session_id, limit=limit)
+            ]
+        else:
+            checkpoints = await _workflow.list_checkpoints(limit=limit)
+            
+            # Format each checkpoint for display
+            formatted_checkpoints = [format_checkpoint_info(cp) for cp in checkpoints]
         
         return CheckpointResponse(
             success=True,
-            message=f"Found {len(checkpoints)} checkpoints",
-            data={"checkpoints": formatted_checkpoints, "count": len(checkpoints)}
+            message=f"Found {len(formatted_checkpoints)} checkpoints",
+            data={"checkpoints": formatted_checkpoints, "count": len(formatted_checkpoints)}
         )
         
     except Exception as e:
@@ -5,29 +5,47 @@ This module provides helper functions for checkpoint management,
 serialization, and validation.
 """
 
+import re
 import sys
-import json
+import time
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
+
+from bson import encode as bson_encode
+from bson.codec_options import CodecOptions, TypeRegistry
 
 logger = logging.getLogger(__name__)
 
+# Encode values BSON has no type for as strings when measuring checkpoint size
+_SIZE_CODEC_OPTIONS = CodecOptions(type_registry=TypeRegistry(fallback_encoder=str))
+
+_MB_INV = 1.0 / (1024 * 1024)
+
+# Alphanumeric characters, underscores and hyphens, 1 to 128 characters
+_SESSION_ID_RE = re.compile(r"[A-Za-z0-9_-]{1,128}")
+
 
 def get_checkpoint_size(checkpoint: Dict[str, Any]) -> int:
     """
     Calculate the size of a checkpoint in bytes.
     
+    Uses the size computed by MongoDB when the checkpoint was listed with
+    one, otherwise the length of the checkpoint encoded as BSON.
+    
     Args:
         checkpoint: The checkpoint data
         
     Returns:
         Size in bytes
     """
+    size_bytes = checkpoint.get("size_bytes")
+    if size_bytes is not None:
+        return size_bytes
+    
     try:
-        # Serialize to JSON to get accurate size
-        serialized = json.dumps(checkpoint, default=str)
-        return sys.getsizeof(serialized)
+        return len(bson_encode(checkpoint, codec_options=_SIZE_CODEC_OPTIONS))
     except Exception as e:
         logger.error(f"Failed to calculate checkpoint size: {e}")
         return 0
@@ -37,6 +55,9 @@ def is_checkpoint_expired(checkpoint: Dict[str, Any], ttl_days: int) -> bool:
     """
     Check if a checkpoint has expired based on TTL.
     
+    Compares epoch seconds, preferring the ts_epoch field set on listed
+    checkpoints and only parsing the timestamp field when it is missing.
+    
     Args:
         checkpoint: The checkpoint data
         ttl_days: Time to live in days
@@ -45,17 +66,20 @@ def is_checkpoint_expired(checkpoint: Dict[str, Any], ttl_days: int) -> bool:
         True if expired, False otherwise
     """
     try:
-        timestamp = checkpoint.get("timestamp")
-        if not timestamp:
-            return False
-            
-        if isinstance(timestamp, str):
-            checkpoint_time = datetime.fromisoformat(timestamp)
-        else:
-            checkpoint_time = timestamp
+        ts_epoch = checkpoint.get("ts_epoch")
+        if ts_epoch is None:
+            timestamp = checkpoint.get("timestamp")
+            if not timestamp:
+                return False
             
-        expiry_time = checkpoint_time + timedelta(days=ttl_days)
-        return datetime.now(timezone.utc) > expiry_time
+            if isinstance(timestamp, (int, float)):
+                ts_epoch = timestamp
+            elif isinstance(timestamp, str):
+                ts_epoch = datetime.fromisoformat(timestamp).timestamp()
+            else:
+                ts_epoch = timestamp.timestamp()
+        
+        return time.time() - ts_epoch > ttl_days * 86400
         
     except Exception as e:
         logger.error(f"Failed to check checkpoint expiry: {e}")
@@ -73,21 +97,18 @@ def format_checkpoint_info(checkpoint: Dict[str, Any]) -> Dict[str, Any]:
         Formatted checkpoint information
     """
     try:
-        info = {
+        size_bytes = get_checkpoint_size(checkpoint)
+        return {
             "thread_id": checkpoint.get("thread_id", "unknown"),
             "checkpoint_id": checkpoint.get("checkpoint_id", ""),
             "checkpoint_ns": checkpoint.get("checkpoint_ns", ""),
             "timestamp": checkpoint.get("timestamp", ""),
-            "size_bytes": get_checkpoint_size(checkpoint),
-            "metadata": checkpoint.get("metadata", {})
+            "size_bytes": size_bytes,
+            "metadata": checkpoint.get("metadata", {}),
+            # Human-readable size
+            "size_mb": round(size_bytes * _MB_INV, 2)
         }
         
-        # Add human-readable size
-        size_mb = info["size_bytes"] / (1024 * 1024)
-        info["size_mb"] = round(size_mb, 2)
-        
-        return info
-        
     except Exception as e:
         logger.error(f"Failed to format checkpoint info: {e}")
         return {
@@ -109,20 +130,19 @@ def validate_session_id(session_id: str) -> bool:
     if not session_id:
         return False
         
-    # Session ID should be alphanumeric with underscores
+    # Session ID should be alphanumeric with underscores and hyphens,
     # and between 1 and 128 characters
-    if not 1 <= len(session_id) <= 128:
-        return False
-        
-    # Allow alphanumeric, underscores, and hyphens
-    allowed_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-")
-    return all(c in allowed_chars for c in session_id)
+    return _SESSION_ID_RE.fullmatch(session_id) is not None
 
 
+@lru_cache(maxsize=256)
 def generate_checkpoint_namespace(workflow_type: str, node_name: Optional[str] = None) -> str:
     """
     Generate a checkpoint namespace based on workflow type and node.
     
+    Workflow types and node names form a small closed set, so namespaces are
+    memoized per (workflow_type, node_name) and returned interned.
+    
     Args:
         workflow_type: Type of workflow (e.g., "QUERY", "ACTION")
         node_name: Optional node name for node-specific checkpoints
@@ -133,4 +153,4 @@ def generate_checkpoint_namespace(workflow_type: str, node_name: Optional[str] =
     namespace = f"workflow_{workflow_type.lower()}"
     if node_name:
         namespace = f"{namespace}_{node_name}"
-    return namespace
\ No newline at end of file
+    return sys.intern(namespace)
\ No newline at end of file
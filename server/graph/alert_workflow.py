@@ -1,12 +1,16 @@
 """Alert Analysis Workflow using LangGraph"""
 
-import os
-from typing import Dict, Any, Optional
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Mapping
+from langgraph.cache.memory import InMemoryCache
 from langgraph.graph import StateGraph, END
-from langfuse import observe
+from langgraph.types import CachePolicy
+from utils.tracing import observe
 
-from .state import WorkflowState, create_initial_state
+from .state import AlertAnalysisState, AlertWorkflowState, create_initial_state, generate_session_id
 from .nodes.alert_analysis_nodes import (
+    safe_json_dumps,
     alert_context_node,
     alert_analysis_mode_node,
     rag_search_node,
@@ -14,7 +18,115 @@ from .nodes.alert_analysis_nodes import (
     alert_decision_node,
     alert_result_node
 )
-from checkpointing import get_checkpointer
+
+logger = logging.getLogger(__name__)
+
+# How long cached LLM node results are reused, e.g. for repeated notifications
+# of the same alert, and how many results are kept per node
+ALERT_NODE_CACHE_TTL = 300
+ALERT_NODE_CACHE_MAX_ENTRIES = 256
+
+# Fields the alert routes stamp on every notification; they differ between
+# repeats of the same alert, so they are left out of the cache key
+_PER_REQUEST_ALERT_FIELDS = ("received_at", "session_id")
+
+
+class _BoundedInMemoryCache(InMemoryCache):
+    """
+    InMemoryCache that drops expired entries on every write and keeps at
+    most max_entries per node, oldest first.
+    
+    InMemoryCache only evicts an expired entry when its key is read again,
+    and keys for distinct alerts never are.
+    """
+    
+    def __init__(self, max_entries: int):
+        super().__init__()
+        self.max_entries = max_entries
+    
+    def set(self, keys: Mapping) -> None:
+        with self._lock:
+            super().set(keys)
+            now = datetime.now(timezone.utc).timestamp()
+            for entries in self._cache.values():
+                expired = [key for key, (_, _, expiry) in entries.items() if expiry is not None and expiry <= now]
+                for key in expired:
+                    del entries[key]
+                while len(entries) > self.max_entries:
+                    del entries[next(iter(entries))]
+
+
+def _cache_key(*inputs: Any) -> str:
+    """Stable cache key for the given node inputs."""
+    return safe_json_dumps(inputs, sort_keys=True)
+
+
+def _analysis_state_key(analysis_state: AlertAnalysisState) -> Dict[str, Any]:
+    """
+    JSON form of analysis_state for cache keys.
+    
+    confidence_level is normalised because an int assigned by a node comes
+    back as a float once the state has gone through the cache.
+    """
+    data = analysis_state.model_dump(mode="json")
+    data["confidence_level"] = float(data["confidence_level"])
+    return data
+
+
+def _alert_context_cache_key(state: AlertWorkflowState) -> str:
+    """The context node reads only the alert itself."""
+    alert_data = state.user_context.get("alert_data", {})
+    return _cache_key({k: v for k, v in alert_data.items() if k not in _PER_REQUEST_ALERT_FIELDS})
+
+
+def _alert_analysis_cache_key(state: AlertWorkflowState) -> str:
+    """
+    The analysis node reads the alert context and the analysis progress.
+    
+    The iteration counter is part of analysis_state, so a loop never replays
+    its own previous iteration.
+    """
+    return _cache_key(state.user_context.get("alert_context", {}), _analysis_state_key(state.analysis_state))
+
+
+def _rag_search_cache_key(state: AlertWorkflowState) -> str:
+    """RAG search reads the alert context and the requested search."""
+    return _cache_key(
+        state.user_context.get("alert_context", {}),
+        state.user_context.get("rag_needed", False),
+        state.user_context.get("rag_request", {})
+    )
+
+
+# Validated once; each run copies it and replaces only the per-run fields
+_STATE_TEMPLATE = create_initial_state(
+    user_input="Alert analysis requested",
+    session_id="alert_template",
+    user_context={"workflow_type": "alert_analysis"}
+)
+
+
+def _initial_alert_state(alert_data: Dict[str, Any]) -> AlertWorkflowState:
+    """
+    Build the initial state for an alert run from the shared template.
+    
+    Every mutable field is replaced so runs never share containers with
+    the template or with each other. The fields were validated with the
+    template, so the state is constructed without validating again;
+    remaining_steps is left unset because LangGraph fills it in per node.
+    """
+    now = datetime.now()
+    return AlertWorkflowState.model_construct(**{
+        **dict(_STATE_TEMPLATE),
+        "session_id": generate_session_id(),
+        "timestamp": now,
+        "memory_instructions": [],
+        "execution_path": ["start"],
+        "node_results": {},
+        "metadata": {**_STATE_TEMPLATE.metadata, "created_at": now.isoformat()},
+        "user_context": {**_STATE_TEMPLATE.user_context, "alert_data": alert_data},
+        "analysis_state": AlertAnalysisState()
+    })
 
 
 class AlertAnalysisWorkflow:
@@ -23,28 +135,33 @@ class AlertAnalysisWorkflow:
     def __init__(self):
         self.graph = self._build_graph()
         self.checkpointer = None
-        self.compiled_graph = None
-    
-    async def initialize(self):
-        """Initialize the workflow with checkpointing."""
-        try:
-            # Temporarily disable checkpointing for alert workflow
-            # self.checkpointer = await get_checkpointer()
-            # self.compiled_graph = self.graph.compile(checkpointer=self.checkpointer)
-            self.compiled_graph = self.graph.compile()
-            print("[ALERT WORKFLOW] Initialized without checkpointing")
-        except Exception as e:
-            print(f"[ALERT WORKFLOW] Failed to initialize: {e}")
-            raise
+        self.cache = _BoundedInMemoryCache(ALERT_NODE_CACHE_MAX_ENTRIES)
+        
+        # Compilation is synchronous, so the graph is compiled once here rather
+        # than lazily by whichever request arrives first
+        # Checkpointing is temporarily disabled for the alert workflow:
+        # self.checkpointer = await get_checkpointer()
+        # self.compiled_graph = self.graph.compile(checkpointer=self.checkpointer)
+        self.compiled_graph = self.graph.compile(cache=self.cache)
+        logger.info("[ALERT WORKFLOW] Initialized without checkpointing")
     
     def _build_graph(self) -> StateGraph:
         """Build the alert analysis workflow graph."""
-        workflow = StateGraph(WorkflowState)
+        workflow = StateGraph(AlertWorkflowState)
         
-        # Add nodes
-        workflow.add_node("alert_context", alert_context_node)
-        workflow.add_node("alert_analysis", alert_analysis_mode_node)
-        workflow.add_node("rag_search", rag_search_node)
+        # Add nodes; the LLM-bound nodes skip recomputation for identical inputs
+        workflow.add_node(
+            "alert_context", alert_context_node,
+            cache_policy=CachePolicy(key_func=_alert_context_cache_key, ttl=ALERT_NODE_CACHE_TTL)
+        )
+        workflow.add_node(
+            "alert_analysis", alert_analysis_mode_node,
+            cache_policy=CachePolicy(key_func=_alert_analysis_cache_key, ttl=ALERT_NODE_CACHE_TTL)
+        )
+        workflow.add_node(
+            "rag_search", rag_search_node,
+            cache_policy=CachePolicy(key_func=_rag_search_cache_key, ttl=ALERT_NODE_CACHE_TTL)
+        )
         workflow.add_node("memory_aggregation", memory_aggregation_node)
         workflow.add_node("alert_decision", alert_decision_node)
         workflow.add_node("alert_result", alert_result_node)
@@ -52,66 +169,15 @@ class AlertAnalysisWorkflow:
         # Set entry point
         workflow.set_entry_point("alert_context")
         
-        # Add edges
+        # Add edges; alert_analysis and alert_decision route themselves by
+        # returning Command(goto=...) together with their update
         workflow.add_edge("alert_context", "alert_analysis")
         
-        # Conditional routing from alert_analysis
-        def route_from_analysis(state: WorkflowState) -> str:
-            if state.user_context.get("rag_needed", False):
-                return "rag_search"
-            elif state.user_context.get("memory_needed", False):
-                return "memory_aggregation"
-            elif state.user_context.get("analysis_state", {}).get("status") == "complete":
-                return "alert_decision"
-            else:
-                return "alert_decision"
-        
-        workflow.add_conditional_edges(
-            "alert_analysis",
-            route_from_analysis,
-            {
-                "rag_search": "rag_search",
-                "memory_aggregation": "memory_aggregation",
-                "alert_decision": "alert_decision"
-            }
-        )
-        
-        # Route from RAG search
-        def route_from_rag(state: WorkflowState) -> str:
-            if state.user_context.get("memory_needed", False):
-                return "memory_aggregation"
-            else:
-                return "alert_analysis"
-        
-        workflow.add_conditional_edges(
-            "rag_search",
-            route_from_rag,
-            {
-                "memory_aggregation": "memory_aggregation",
-                "alert_analysis": "alert_analysis"
-            }
-        )
-        
-        # Route from memory aggregation back to analysis
+        # RAG search and memory aggregation (possibly run in parallel) both
+        # lead back to analysis, which runs once both have finished
+        workflow.add_edge("rag_search", "alert_analysis")
         workflow.add_edge("memory_aggregation", "alert_analysis")
         
-        # Route from alert decision
-        def route_from_decision(state: WorkflowState) -> str:
-            decision = state.user_context.get("analysis_decision", {})
-            if decision.get("decision") == "need_more_analysis":
-                return "alert_analysis"
-            else:
-                return "alert_result"
-        
-        workflow.add_conditional_edges(
-            "alert_decision",
-            route_from_decision,
-            {
-                "alert_analysis": "alert_analysis",
-                "alert_result": "alert_result"
-            }
-        )
-        
         # End after result generation
         workflow.add_edge("alert_result", END)
         
@@ -121,17 +187,8 @@ class AlertAnalysisWorkflow:
     async def invoke(self, alert_data: Dict[str, Any], config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Invoke the alert analysis workflow."""
         try:
-            if not self.compiled_graph:
-                await self.initialize()
-            
             # Create initial state
-            initial_state = create_initial_state(
-                user_input="Alert analysis requested",
-                user_context={
-                    "alert_data": alert_data,
-                    "workflow_type": "alert_analysis"
-                }
-            )
+            initial_state = _initial_alert_state(alert_data)
             
             print(f"[ALERT WORKFLOW] Starting workflow with alert: {alert_data.get('labels', {}).get('alertname', 'Unknown')}")
             
@@ -141,15 +198,13 @@ class AlertAnalysisWorkflow:
             run_config["recursion_limit"] = 50
             
             result = await self.compiled_graph.ainvoke(initial_state, run_config)
-        except Exception as e:
-            print(f"[ALERT WORKFLOW] Error during workflow execution: {e}")
-            print(f"[ALERT WORKFLOW] Error type: {type(e).__name__}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("[ALERT WORKFLOW] Error during workflow execution")
             raise
         
         # Result is a dict-like object from LangGraph
         user_context = result.get("user_context", {})
+        analysis_state = AlertAnalysisState.model_validate(result.get("analysis_state") or {})
         final_result = result.get("final_result", {})
         
         return {
@@ -157,8 +212,8 @@ class AlertAnalysisWorkflow:
             "alert_report": user_context.get("alert_report", {}),
             "markdown_content": final_result.get("answer", "") if final_result else "",
             "analysis_metadata": {
-                "iterations": user_context.get("analysis_state", {}).get("iterations", 0),
-                "tools_used": user_context.get("analysis_state", {}).get("tools_used", []),
+                "iterations": analysis_state.iterations,
+                "tools_used": analysis_state.tools_used,
                 "confidence_score": user_context.get("analysis_decision", {}).get("confidence_score", 0),
                 "findings_count": len(user_context.get("key_findings", []))
             }
@@ -166,25 +221,20 @@ class AlertAnalysisWorkflow:
     
     async def stream(self, alert_data: Dict[str, Any], config: Optional[Dict[str, Any]] = None):
         """Stream the alert analysis workflow execution."""
-        if not self.compiled_graph:
-            await self.initialize()
-        
         # Create initial state
-        initial_state = create_initial_state(
-            user_input="Alert analysis requested",
-            user_context={
-                "alert_data": alert_data,
-                "workflow_type": "alert_analysis"
-            }
-        )
+        initial_state = _initial_alert_state(alert_data)
+        
+        # Stream only the channels each step changed, not full state snapshots
+        async for event in self.compiled_graph.astream(initial_state, config, stream_mode="updates"):
+            yield event
+    
+    async def stream_messages(self, alert_data: Dict[str, Any], config: Optional[Dict[str, Any]] = None):
+        """Stream LLM output from the alert analysis workflow token by token."""
+        initial_state = _initial_alert_state(alert_data)
         
-        # Stream the workflow
-        if config:
-            async for event in self.compiled_graph.astream(initial_state, config):
-                yield event
-        else:
-            async for event in self.compiled_graph.astream(initial_state):
-                yield event
+        async for chunk, metadata in self.compiled_graph.astream(initial_state, config, stream_mode="messages"):
+            if chunk.content:
+                yield {"node": metadata.get("langgraph_node"), "content": chunk.content}
 
 
 # Create singleton instance
@@ -6,15 +6,22 @@ and routes metrics-related requests to the prometheus node.
 """
 
 import logging
+import sys
 from typing import Dict, Any
-from langfuse import observe
+from utils.tracing import observe
 
 from ...state import WorkflowState, update_state_node
 from .analyzers import analyze_action_requirements
-from .processors import process_non_metrics_action, process_prometheus_result
+from .processors import process_non_metrics_action, process_prometheus_result, process_loki_result
 
 logger = logging.getLogger(__name__)
 
+# Static part of the action context stored for the data collection nodes
+_ACTION_CONTEXT_TEMPLATE = {
+    "workflow_type": "action",
+    "processing_stage": "data_collection"
+}
+
 
 class ActionNode:
     """
@@ -27,6 +34,8 @@ class ActionNode:
     def __init__(self):
         """Initialize the action node."""
         self.node_name = "action"
+        # Metadata key for execution info, built once instead of per call
+        self.execution_key = sys.intern(f"{self.node_name}_execution")
 
     
     @observe(name="action_node")
@@ -42,69 +51,77 @@ class ActionNode:
         """
         # Use enhanced input if available
         action_input = state.enhanced_input or state.user_input
-        logger.info(f"Executing action node for input: {action_input[:100]}...")
+        logger.info("Executing action node for input: %.100s...", action_input)
         
         # Update state to indicate action node execution
         state = update_state_node(state, self.node_name)
         
+        # Metadata writes are collected here and applied together once the
+        # action is fully processed, so a failure leaves no partial routing flags
+        pending: Dict[str, Any] = {}
+        
         try:
-            # Analyze the action request to determine data requirements
+            # Analyze the action request to determine data requirements; the
+            # same request answers actions that need no external data
             action_analysis = await analyze_action_requirements(action_input)
+            direct_response = action_analysis.pop("direct_response", None)
             
             # Extract data requirements
             needs_metrics = action_analysis.get("needs_metrics", False)
             needs_logs = action_analysis.get("needs_logs", False)
             needs_alerts = action_analysis.get("needs_alerts", False)
             
-            logger.info(f"Data requirements - Metrics: {needs_metrics}, Logs: {needs_logs}, Alerts: {needs_alerts}")
+            logger.info("Data requirements - Metrics: %s, Logs: %s, Alerts: %s", needs_metrics, needs_logs, needs_alerts)
             
             # Store data requirements and context
-            state.metadata["data_requirements"] = action_analysis
-            state.metadata["originating_node"] = "action"
-            state.metadata["action_context"] = {
-                "workflow_type": "action",
-                "user_input": action_input,
-                "action_type": action_analysis.get("action_type", "data_analysis"),
-                "data_requirements": action_analysis.get("data_requirements", {}),
-                "processing_stage": "data_collection"
-            }
+            pending["data_requirements"] = action_analysis
+            pending["originating_node"] = "action"
+            action_context = _ACTION_CONTEXT_TEMPLATE.copy()
+            action_context["user_input"] = action_input
+            action_context["action_type"] = action_analysis.get("action_type", "data_analysis")
+            action_context["data_requirements"] = action_analysis.get("data_requirements", {})
+            pending["action_context"] = action_context
             
             # Determine routing based on data needs
             data_sources_needed = []
             if needs_metrics:
                 data_sources_needed.append("prometheus")
-                state.metadata["needs_prometheus"] = True
+                pending["needs_prometheus"] = True
             if needs_logs:
                 data_sources_needed.append("loki")
-                state.metadata["needs_loki"] = True
+                pending["needs_loki"] = True
             if needs_alerts:
                 data_sources_needed.append("alertmanager")
-                state.metadata["needs_alertmanager"] = True
-                state.metadata["alertmanager_requested_by"] = "action"
+                pending["needs_alertmanager"] = True
+                pending["alertmanager_requested_by"] = "action"
             
             if data_sources_needed:
-                logger.info(f"Action requires data from: {', '.join(data_sources_needed)}")
+                logger.info("Action requires data from: %s", ", ".join(data_sources_needed))
                 # Set up data collection sequence
-                state.metadata["data_collection_sequence"] = data_sources_needed
-                state.metadata["next_node"] = data_sources_needed[0]
+                pending["data_collection_sequence"] = data_sources_needed
+                pending["next_node"] = data_sources_needed[0]
                 
             else:
                 logger.info("Action can be handled without external data")
-                # Process action directly without metrics or logs
-                result = await process_non_metrics_action(action_input, action_analysis)
+                if direct_response:
+                    # Answered alongside the analysis, no formatting call needed
+                    result = {"success": True, "data": direct_response}
+                else:
+                    # Process action directly without metrics or logs
+                    result = await process_non_metrics_action(action_input, action_analysis)
                 
                 if result["success"]:
-                    state.metadata["action_result"] = result["data"]
-                    state.metadata["next_node"] = "action_output"
+                    pending["action_result"] = result["data"]
+                    pending["next_node"] = "action_output"
                 else:
                     state.error_message = result.get("error", "Failed to process action")
-                    state.metadata["next_node"] = "error_handler"
+                    pending["next_node"] = "error_handler"
             
             # Store action analysis for later use
-            state.metadata["action_analysis"] = action_analysis
+            pending["action_analysis"] = action_analysis
             
             # Store detailed execution info in metadata
-            state.metadata[f"{self.node_name}_execution"] = {
+            pending[self.execution_key] = {
                 "timestamp": state.metadata.get("current_timestamp"),
                 "status": "completed" if not state.error_message else "error",
                 "needs_metrics": needs_metrics,
@@ -112,18 +129,21 @@ class ActionNode:
                 "needs_alerts": needs_alerts,
                 "action_type": action_analysis.get("action_type", "unknown")
             }
+            state.metadata.update(pending)
             
         except Exception as e:
             logger.error(f"Error in action node: {str(e)}")
             state.error_message = f"Action processing failed: {str(e)}"
-            state.metadata["next_node"] = "error_handler"
             
-            # Store error execution info in metadata
-            state.metadata[f"{self.node_name}_execution"] = {
-                "timestamp": state.metadata.get("current_timestamp"),
-                "status": "error",
-                "error": str(e)
-            }
+            # Only the error routing and execution info are written
+            state.metadata.update({
+                "next_node": "error_handler",
+                self.execution_key: {
+                    "timestamp": state.metadata.get("current_timestamp"),
+                    "status": "error",
+                    "error": str(e)
+                }
+            })
         
         return state
     
@@ -153,8 +173,6 @@ class ActionNode:
         Returns:
             Updated workflow state with processed results
         """
-        # Import here to avoid circular dependency
-        from .processors import process_loki_result
         return await process_loki_result(state, loki_data, self.node_name)
     
     async def process_alertmanager_result(self, state: WorkflowState, alert_data: Dict[str, Any]) -> WorkflowState:
@@ -193,23 +211,19 @@ class ActionNode:
         if state.error_message:
             return "error_handler"
 
-        # Check if we're in a data collection sequence
-        
-        # Check what data has been collected
-        prometheus_done = state.metadata.get("prometheus_collection_complete", False)
-        loki_done = state.metadata.get("loki_collection_complete", False)
-        alertmanager_done = state.metadata.get("alertmanager_collection_complete", False)
+        metadata = state.metadata
         
-        # Route to next data source if needed
-        if state.metadata.get("needs_prometheus") and not prometheus_done:
+        # Route to the next requested data source that has not been collected;
+        # completion flags are only read for sources that were requested
+        if metadata.get("needs_prometheus") and not metadata.get("prometheus_collection_complete"):
             return "prometheus"
-        elif state.metadata.get("needs_loki") and not loki_done:
+        elif metadata.get("needs_loki") and not metadata.get("loki_collection_complete"):
             return "loki"
-        elif state.metadata.get("needs_alertmanager") and not alertmanager_done:
+        elif metadata.get("needs_alertmanager") and not metadata.get("alertmanager_collection_complete"):
             return "alertmanager"
         
         # All data collected, route to output
-        return state.metadata.get("next_node", "action_output")
+        return metadata.get("next_node", "action_output")
 
 
 # Create singleton instance
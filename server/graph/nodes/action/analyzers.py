@@ -5,15 +5,83 @@ This module provides utilities for analyzing action requests to determine
 data requirements and action types.
 """
 
-import json
+import asyncio
+import copy
 import logging
-from typing import Dict, Any
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Tuple
+
+import orjson
 
 from llm.openai import openai
-from prompts.workflows.analyzer_prompts import get_analyzer_prompt, ANALYZER_SYSTEM_PROMPT
+from prompts.workflows.analyzer_prompts import (
+    get_analyzer_prompt,
+    ANALYZER_SYSTEM_PROMPT,
+    ACTION_ANALYZER_RESPONSE_FORMAT
+)
 
 logger = logging.getLogger(__name__)
 
+# Any explicit log keyword as a whole word, matched in one pass
+_LOG_KEYWORDS_RE = re.compile(
+    r"\b(?:logs?|error message|stack trace|exception|debug|console output|logging)\b",
+    re.IGNORECASE
+)
+
+# Successful analyses keyed by the rendered prompt, so a template change
+# never serves a stale entry; entries expire so prompt tuning on the model
+# side is picked up eventually
+_ANALYSIS_CACHE_SIZE = 1024
+_ANALYSIS_CACHE_TTL = 600
+_analysis_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# Requests currently being analyzed; concurrent identical requests await
+# the same OpenAI call instead of issuing their own
+_analysis_inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+
+async def _request_action_analysis(user_input: str, analysis_prompt: str) -> Dict[str, Any]:
+    """
+    Run the OpenAI analysis for a request and cache the result.
+    
+    Args:
+        user_input: The user's action request
+        analysis_prompt: Rendered analyzer prompt for the request
+        
+    Returns:
+        Dictionary containing action analysis results
+    """
+    response = await openai.chat_completion(
+        user_message=analysis_prompt,
+        system_prompt=ANALYZER_SYSTEM_PROMPT,
+        temperature=0.1,
+        response_format=ACTION_ANALYZER_RESPONSE_FORMAT
+    )
+
+    if not response["success"]:
+        raise Exception(response.get("error", "OpenAI request failed"))
+
+    result = orjson.loads(response["content"])
+    
+    # Double-check log requirement - only if explicitly mentioned
+    needs_logs = result.get("needs_logs", False)
+    if needs_logs:
+        # Verify user actually asked for logs
+        has_log_keyword = _LOG_KEYWORDS_RE.search(user_input) is not None
+        
+        if not has_log_keyword:
+            logger.info(f"Overriding needs_logs=True to False - no explicit log keywords found in: {user_input[:100]}")
+            needs_logs = False
+            result["needs_logs"] = False
+    
+    _analysis_cache[analysis_prompt] = (time.monotonic(), copy.deepcopy(result))
+    if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+        _analysis_cache.popitem(last=False)
+    
+    return result
+
 
 async def analyze_action_requirements(user_input: str) -> Dict[str, Any]:
     """
@@ -32,31 +100,31 @@ async def analyze_action_requirements(user_input: str) -> Dict[str, Any]:
             user_input=user_input
         )
         
-        response = await openai.chat_completion(
-            user_message=analysis_prompt,
-            system_prompt=ANALYZER_SYSTEM_PROMPT,
-            temperature=0.1
-        )
-
-        if not response["success"]:
-            raise Exception(response.get("error", "OpenAI request failed"))
-
-        result = json.loads(response["content"])
+        cached = _analysis_cache.get(analysis_prompt)
+        if cached is not None:
+            cached_at, cached_result = cached
+            if time.monotonic() - cached_at < _ANALYSIS_CACHE_TTL:
+                _analysis_cache.move_to_end(analysis_prompt)
+                logger.debug("Using cached action analysis")
+                return copy.deepcopy(cached_result)
+            del _analysis_cache[analysis_prompt]
+        
+        pending = _analysis_inflight.get(analysis_prompt)
+        if pending is not None:
+            logger.debug("Awaiting in-flight action analysis")
+            return copy.deepcopy(await asyncio.shield(pending))
         
-        # Double-check log requirement - only if explicitly mentioned
-        needs_logs = result.get("needs_logs", False)
-        if needs_logs:
-            # Verify user actually asked for logs
-            log_keywords = ["log", "logs", "error message", "stack trace", "exception", "debug", "console output", "logging"]
-            user_input_lower = user_input.lower()
-            has_log_keyword = any(keyword in user_input_lower for keyword in log_keywords)
-            
-            if not has_log_keyword:
-                logger.info(f"Overriding needs_logs=True to False - no explicit log keywords found in: {user_input[:100]}")
-                needs_logs = False
-                result["needs_logs"] = False
+        task = asyncio.ensure_future(_request_action_analysis(user_input, analysis_prompt))
+        _analysis_inflight[analysis_prompt] = task
+        try:
+            result = await asyncio.shield(task)
+        finally:
+            if task.done():
+                _analysis_inflight.pop(analysis_prompt, None)
+            else:
+                task.add_done_callback(lambda _: _analysis_inflight.pop(analysis_prompt, None))
         
-        return result
+        return copy.deepcopy(result)
         
     except Exception as e:
         logger.error(f"Error analyzing action requirements: {str(e)}")
@@ -5,21 +5,104 @@ This module provides utilities for processing different types of actions,
 including non-metrics actions and prometheus result processing.
 """
 
-import json
+import asyncio
+import copy
+import hashlib
 import logging
-from typing import Dict, Any
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+import orjson
+from pydantic import BaseModel
 
 from llm.openai import openai
 from prompts.data_collection.action_prompts import get_action_prompt
-from prompts.workflows.response_type import get_response_type_prompt
 from prompts.workflows.processor_prompts import get_processor_system_prompt
 from .serializers import serialize_prometheus_data
 from ...state import WorkflowState
-from langfuse import observe
+from utils.tracing import observe
+from langgraph.config import get_stream_writer
 from utils.data_reduction import data_reducer
 
 logger = logging.getLogger(__name__)
 
+_INDENT_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _json_default(obj: Any) -> Any:
+    """Let orjson encode Pydantic models met inside otherwise plain data."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps_compact(data: Any) -> str:
+    """Render data as compact JSON text for prompts; indentation only costs tokens."""
+    return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _dumps_indented(data: Any) -> str:
+    """Render data as indented JSON text for logs."""
+    return orjson.dumps(data, default=_json_default, option=_INDENT_OPTIONS).decode()
+
+
+# Responses above this size are parsed in a worker thread
+_OFFLOAD_THRESHOLD_BYTES = 64 * 1024
+
+
+async def _loads_offloaded(content: str) -> Any:
+    """Parse JSON text, moving large payloads off the event loop."""
+    if len(content) > _OFFLOAD_THRESHOLD_BYTES:
+        return await asyncio.to_thread(orjson.loads, content)
+    return orjson.loads(content)
+
+
+# Sections of serialized prometheus data merged into supporting_metrics, in
+# increasing order of precedence
+_METRIC_KEYS = ("processed_metrics", "current_values", "basic_statistics")
+
+
+def _extract_supporting_metrics(serialized_prometheus_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge the metric value sections of serialized prometheus data."""
+    prometheus_metrics = {}
+    for key in _METRIC_KEYS:
+        prometheus_metrics.update(serialized_prometheus_data.get(key) or {})
+    return prometheus_metrics
+
+
+# Formatted action results keyed by a fingerprint of the request and its data
+_RESULT_CACHE_SIZE = 256
+_action_result_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+
+def _result_fingerprint(user_input: str, action_type: str, collected_json: str) -> bytes:
+    """Fingerprint an action request together with its rendered data."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (user_input, action_type, collected_json):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.digest()
+
+
+# Response types implied by a confident categorization; anything else is left
+# to the model
+_RESPONSE_TYPE_RULES = {
+    ("ACTION", "LOW"): "simple_data",
+    ("ACTION", "HIGH"): "comprehensive_analysis"
+}
+_RESPONSE_TYPE_MIN_CONFIDENCE = 0.8
+
+
+def _resolve_response_type(categorization_data: Dict[str, Any]) -> Optional[str]:
+    """Return the response type a confident categorization implies, if any."""
+    if categorization_data.get("confidence", 0.0) < _RESPONSE_TYPE_MIN_CONFIDENCE:
+        return None
+    key = (
+        categorization_data.get("workflow_type", "ACTION"),
+        categorization_data.get("estimated_complexity", "MEDIUM")
+    )
+    return _RESPONSE_TYPE_RULES.get(key)
+
 
 async def process_non_metrics_action(user_input: str, action_analysis: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -52,8 +135,8 @@ async def process_non_metrics_action(user_input: str, action_analysis: Dict[str,
 
         # Parse JSON response with better error handling
         try:
-            result = json.loads(response["content"])
-        except json.JSONDecodeError as e:
+            result = orjson.loads(response["content"])
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse OpenAI response as JSON: {str(e)}")
             logger.error(f"Response content: {response['content'][:500]}...")  # Log first 500 chars
             # Return a fallback response
@@ -95,10 +178,24 @@ async def process_prometheus_result(state: WorkflowState, prometheus_data: Dict[
         action_context = state.metadata.get("action_context", {})
         action_type = action_context.get("action_type", "data_analysis")
         
+        # When logs are still to be collected, the loki step formats metrics and
+        # logs together, so formatting the metrics alone here would be discarded
+        if state.metadata.get("needs_loki") and not state.metadata.get("loki_collection_complete"):
+            logger.info("Deferring prometheus formatting until loki data is collected")
+            state.metadata["needs_prometheus"] = False
+            state.metadata["prometheus_collection_complete"] = False
+            state.metadata[f"{node_name}_prometheus_processing"] = {
+                "timestamp": state.metadata.get("current_timestamp"),
+                "status": "deferred",
+                "data_processed": False,
+                "action_type": action_type
+            }
+            return state
+        
         # Serialize prometheus data to handle Pydantic objects
         serialized_prometheus_data = serialize_prometheus_data(prometheus_data)
 
-        # Use OpenAI to determine the appropriate response type based on categorization
+        # Categorization guides the model's choice of response type
         categorization = state.categorization
 
         # Build categorization data safely
@@ -112,27 +209,6 @@ async def process_prometheus_result(state: WorkflowState, prometheus_data: Dict[
                 "estimated_complexity": getattr(categorization, 'estimated_complexity', 'MEDIUM')
             }
 
-        response_type_prompt = get_response_type_prompt(
-            user_input=state.user_input,
-            categorization_data=categorization_data
-        )
-
-        response_type_response = await openai.chat_completion(
-            user_message=response_type_prompt,
-            system_prompt=get_processor_system_prompt("ACTION", "response_type"),
-            temperature=0.1
-        )
-
-        if not response_type_response["success"]:
-            # Default to simple data if decision fails
-            response_type = "simple_data"
-        else:
-            try:
-                response_decision = json.loads(response_type_response["content"])
-                response_type = response_decision.get("response_type", "simple_data")
-            except:
-                response_type = "simple_data"
-
         # Check if we have alertmanager data to include
         has_alertmanager_data = state.metadata.get("alertmanager_data") is not None
         collected_data = {"metrics": serialized_prometheus_data}
@@ -166,83 +242,114 @@ async def process_prometheus_result(state: WorkflowState, prometheus_data: Dict[
             reduced_size = data_reducer.estimate_tokens(reduced_alerts)
             logger.info(f"Reduced Alertmanager data from ~{original_size} to ~{reduced_size} tokens")
         
-        # Use appropriate prompt based on OpenAI decision
-        if response_type == "comprehensive_analysis":
-            prompt = get_action_prompt(
-                "analysis",
-                user_input=state.user_input,
-                collected_data=json.dumps(collected_data, indent=2),
-                analysis_scope=action_type
-            )
-        elif response_type == "reporting":
-            prompt = get_action_prompt(
-                "reporting",
-                user_input=state.user_input,
-                data_sources=", ".join(data_sources),
-                time_range=action_context.get("data_requirements", {}).get("time_range", "recent")
-            )
-        else:  # simple_data
-            prompt = get_action_prompt(
-                "output_formatting",
-                user_input=state.user_input,
-                collected_data=json.dumps(collected_data, indent=2),
-                action_type=action_type
-            )
+        # Rendering the collected data is the heaviest step; keep it off the event loop
+        collected_json = await asyncio.to_thread(_dumps_compact, collected_data)
         
-        response = await openai.chat_completion(
-            user_message=prompt,
-            system_prompt=get_processor_system_prompt("ACTION", "metrics"),
-            temperature=0.3
-        )
-
-        if not response["success"]:
-            raise Exception(response.get("error", "OpenAI request failed"))
-
-        # Parse JSON response with better error handling
-        try:
-            result = json.loads(response["content"])
-
-            # Log the OpenAI response for debugging
-            logger.info(f"OpenAI response for action formatting: {json.dumps(result, indent=2)}")
-
-            # Ensure supporting_metrics is populated from prometheus data if missing
-            if "supporting_metrics" not in result or not result["supporting_metrics"]:
-                # Extract metrics from prometheus data
-                prometheus_metrics = {}
-                if "processed_metrics" in serialized_prometheus_data:
-                    prometheus_metrics.update(serialized_prometheus_data["processed_metrics"])
-                if "current_values" in serialized_prometheus_data:
-                    prometheus_metrics.update(serialized_prometheus_data["current_values"])
-                if "basic_statistics" in serialized_prometheus_data:
-                    prometheus_metrics.update(serialized_prometheus_data["basic_statistics"])
-
+        # A retry or re-fetch that returns the same data for the same request
+        # reuses the earlier result instead of calling OpenAI again
+        fingerprint = _result_fingerprint(state.user_input, action_type, collected_json)
+        cached = _action_result_cache.get(fingerprint)
+        if cached is not None:
+            _action_result_cache.move_to_end(fingerprint)
+            logger.info("Reusing action result for unchanged prometheus data")
+            result = copy.deepcopy(cached)
+        else:
+            # A confident categorization settles the response type, so the model
+            # gets the shorter type-specific prompt; otherwise it chooses the
+            # type and formats the result in a single call
+            response_type = _resolve_response_type(categorization_data)
+            if response_type == "comprehensive_analysis":
+                prompt = get_action_prompt(
+                    "analysis",
+                    user_input=state.user_input,
+                    collected_data=collected_json,
+                    analysis_scope=action_type
+                )
+            elif response_type == "simple_data":
+                prompt = get_action_prompt(
+                    "output_formatting",
+                    user_input=state.user_input,
+                    collected_data=collected_json,
+                    action_type=action_type
+                )
+            else:
+                prompt = get_action_prompt(
+                    "metrics_response",
+                    user_input=state.user_input,
+                    categorization_data=_dumps_compact(categorization_data),
+                    collected_data=collected_json,
+                    data_sources=", ".join(data_sources),
+                    time_range=action_context.get("data_requirements", {}).get("time_range", "recent"),
+                    action_type=action_type
+                )
+            
+            # Stream the completion so partial output reaches custom stream consumers
+            # while the rest of the JSON is still being generated
+            writer = get_stream_writer()
+            chunks = []
+            try:
+                async for delta in openai.chat_completion_stream(
+                    user_message=prompt,
+                    system_prompt=get_processor_system_prompt("ACTION", "metrics"),
+                    temperature=0.3
+                ):
+                    chunks.append(delta)
+                    writer({"node": node_name, "token": delta})
+                response = {"success": True, "content": "".join(chunks)}
+            except Exception as e:
+                response = {"success": False, "error": str(e), "content": None}
+
+            if not response["success"]:
+                raise Exception(response.get("error", "OpenAI request failed"))
+
+            # Parse JSON response with better error handling
+            cacheable = False
+            try:
+                response_decision = await _loads_offloaded(response["content"])
+                response_type = response_decision.get("response_type", response_type or "simple_data")
+                result = response_decision.get("formatted_result")
+                if not isinstance(result, dict):
+                    result = {k: v for k, v in response_decision.items() if k != "formatted_result"}
+                result.setdefault("response_type", response_type)
+                cacheable = True
+
+                # Log the OpenAI response for debugging
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"OpenAI response for action formatting: {_dumps_indented(result)}")
+
+                # Ensure supporting_metrics is populated from prometheus data if missing
+                if "supporting_metrics" not in result or not result["supporting_metrics"]:
+                    # Extract metrics from prometheus data
+                    prometheus_metrics = _extract_supporting_metrics(serialized_prometheus_data)
+
+                    if prometheus_metrics:
+                        result["supporting_metrics"] = prometheus_metrics
+                        logger.info(f"Added supporting_metrics from prometheus data: {prometheus_metrics}")
+                    else:
+                        logger.warning(f"No metrics found in prometheus data. Available keys: {list(serialized_prometheus_data.keys())}")
+                else:
+                    logger.info(f"OpenAI response already contains supporting_metrics: {result['supporting_metrics']}")
+
+            except orjson.JSONDecodeError as e:
+                logger.error(f"Failed to parse OpenAI response as JSON: {str(e)}")
+                logger.error(f"Response content: {response['content'][:500]}...")  # Log first 500 chars
+                # Return a fallback response with metrics from prometheus data if available
+                result = {
+                    "error": "Failed to parse OpenAI response",
+                    "action_type": action_type,
+                    "execution_status": "failed",
+                    "analysis_results": "Unable to process the action results due to JSON parsing error"
+                }
+
+                # Try to extract metrics from prometheus data even on error
+                prometheus_metrics = _extract_supporting_metrics(serialized_prometheus_data)
                 if prometheus_metrics:
                     result["supporting_metrics"] = prometheus_metrics
-                    logger.info(f"Added supporting_metrics from prometheus data: {prometheus_metrics}")
-                else:
-                    logger.warning(f"No metrics found in prometheus data. Available keys: {list(serialized_prometheus_data.keys())}")
-            else:
-                logger.info(f"OpenAI response already contains supporting_metrics: {result['supporting_metrics']}")
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse OpenAI response as JSON: {str(e)}")
-            logger.error(f"Response content: {response['content'][:500]}...")  # Log first 500 chars
-            # Return a fallback response with metrics from prometheus data if available
-            result = {
-                "error": "Failed to parse OpenAI response",
-                "action_type": action_type,
-                "execution_status": "failed",
-                "analysis_results": "Unable to process the action results due to JSON parsing error"
-            }
 
-            # Try to extract metrics from prometheus data even on error
-            prometheus_metrics = {}
-            if "processed_metrics" in serialized_prometheus_data:
-                prometheus_metrics.update(serialized_prometheus_data["processed_metrics"])
-            if "current_values" in serialized_prometheus_data:
-                prometheus_metrics.update(serialized_prometheus_data["current_values"])
-            if prometheus_metrics:
-                result["supporting_metrics"] = prometheus_metrics
+            if cacheable:
+                _action_result_cache[fingerprint] = copy.deepcopy(result)
+                if len(_action_result_cache) > _RESULT_CACHE_SIZE:
+                    _action_result_cache.popitem(last=False)
 
         # Store formatted result
         state.metadata["action_result"] = result
@@ -300,11 +407,9 @@ async def process_loki_result(state: WorkflowState, loki_data: Dict[str, Any], n
         data_sources = []
         
         if has_prometheus_data:
-            # Serialize prometheus data
-            prometheus_data = state.metadata.get("prometheus_data", {})
-            from .serializers import serialize_prometheus_data
-            serialized_prometheus = serialize_prometheus_data(prometheus_data)
-            collected_data["metrics"] = serialized_prometheus
+            # The metrics are only rendered into the prompt, so orjson encodes any
+            # Pydantic objects directly instead of building a serialized copy first
+            collected_data["metrics"] = state.metadata.get("prometheus_data", {})
             data_sources.append("Prometheus")
         
         # Add loki data
@@ -319,8 +424,8 @@ async def process_loki_result(state: WorkflowState, loki_data: Dict[str, Any], n
             data_sources.append("Alertmanager")
             logger.info(f"Alertmanager data contains: {len(alert_data.get('alerts', []))} alerts")
         
-        # Format the final response with all collected data
-        from prompts.data_collection.action_prompts import get_action_prompt
+        # Format the final response with all collected data, rendered off the event loop
+        collected_json = await asyncio.to_thread(_dumps_compact, collected_data)
         
         # Determine which prompt to use based on collected data
         if collected_data.get("logs") and collected_data.get("metrics"):
@@ -328,7 +433,7 @@ async def process_loki_result(state: WorkflowState, loki_data: Dict[str, Any], n
             prompt = get_action_prompt(
                 "combined_analysis",
                 user_input=state.user_input,
-                collected_data=json.dumps(collected_data, indent=2),
+                collected_data=collected_json,
                 action_type=action_type
             )
             logger.info("Using combined_analysis prompt for logs and metrics data")
@@ -337,7 +442,7 @@ async def process_loki_result(state: WorkflowState, loki_data: Dict[str, Any], n
             prompt = get_action_prompt(
                 "log_analysis",
                 user_input=state.user_input,
-                collected_data=json.dumps(collected_data, indent=2),
+                collected_data=collected_json,
                 action_type=action_type
             )
             logger.info("Using log_analysis prompt for logs-only data")
@@ -346,7 +451,7 @@ async def process_loki_result(state: WorkflowState, loki_data: Dict[str, Any], n
             prompt = get_action_prompt(
                 "output_formatting",
                 user_input=state.user_input,
-                collected_data=json.dumps(collected_data, indent=2),
+                collected_data=collected_json,
                 action_type=action_type
             )
             logger.info("Using output_formatting prompt for metrics-only data")
@@ -355,7 +460,7 @@ async def process_loki_result(state: WorkflowState, loki_data: Dict[str, Any], n
             prompt = get_action_prompt(
                 "analysis",
                 user_input=state.user_input,
-                collected_data=json.dumps(collected_data, indent=2),
+                collected_data=collected_json,
                 analysis_scope=action_type
             )
             logger.info("Using analysis prompt for empty data")
@@ -379,7 +484,7 @@ async def process_loki_result(state: WorkflowState, loki_data: Dict[str, Any], n
         if not response["success"]:
             raise Exception(response.get("error", "OpenAI request failed"))
 
-        result = json.loads(response["content"])
+        result = await _loads_offloaded(response["content"])
 
         # Set action result and route to output
         state.metadata["action_result"] = result
@@ -8,8 +8,13 @@ particularly Pydantic models, to JSON-compatible formats.
 import logging
 from typing import Dict, Any
 
+from pydantic import TypeAdapter
+
 logger = logging.getLogger(__name__)
 
+# Built once; dumping walks the payload in pydantic-core instead of Python
+_PAYLOAD_ADAPTER = TypeAdapter(Any)
+
 
 def serialize_prometheus_data(prometheus_data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -22,20 +27,7 @@ def serialize_prometheus_data(prometheus_data: Dict[str, Any]) -> Dict[str, Any]
         JSON-serializable dictionary
     """
     try:
-        from pydantic import BaseModel
-
-        def serialize_item(item):
-            """Recursively serialize items, handling Pydantic models."""
-            if isinstance(item, BaseModel):
-                return item.model_dump()  # Convert Pydantic model to dict
-            elif isinstance(item, dict):
-                return {k: serialize_item(v) for k, v in item.items()}
-            elif isinstance(item, list):
-                return [serialize_item(i) for i in item]
-            else:
-                return item
-
-        return serialize_item(prometheus_data)
+        return _PAYLOAD_ADAPTER.dump_python(prometheus_data, mode="json")
 
     except Exception as e:
         logger.warning(f"Failed to serialize prometheus data: {str(e)}")
@@ -1,14 +1,17 @@
 """Alert Analysis Workflow Nodes"""
 
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Literal, Callable, Awaitable
 from datetime import datetime, timedelta
 import asyncio
+import functools
+import os
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
-from langfuse import observe
+from langgraph.types import Command
+from utils.tracing import observe
 
-from ..state import WorkflowState
+from ..state import AlertAnalysisState, AlertWorkflowState
 from utils.json_parser import parse_llm_json
 from pydantic import BaseModel
 from prompts.alert_analysis.alert_context_prompt import (
@@ -37,6 +40,13 @@ from rag.service import RAGService
 from memory.service import MemoryService
 from utils.data_reduction import reduce_data_for_context
 
+# Upper bound for a single data source query batch during alert analysis
+TOOL_TIMEOUT_SECONDS = float(os.getenv("ALERT_ANALYSIS_TOOL_TIMEOUT", "60"))
+
+# Cap on in-flight Prometheus queries per query batch so a long metric list
+# does not flood the Prometheus server
+PROMETHEUS_MAX_CONCURRENT_QUERIES = int(os.getenv("PROMETHEUS_MAX_CONCURRENT_QUERIES", "8"))
+
 
 def safe_json_dumps(obj, **kwargs):
     """Safely convert object to JSON string, handling Pydantic models."""
@@ -62,7 +72,7 @@ def safe_json_dumps(obj, **kwargs):
 
 
 @observe(name="alert_context_node")
-async def alert_context_node(state: WorkflowState) -> WorkflowState:
+async def alert_context_node(state: AlertWorkflowState) -> Dict[str, Any]:
     """Extract comprehensive context from the alert."""
     print(f"\n[ALERT CONTEXT NODE] Starting analysis...")
     
@@ -101,17 +111,13 @@ async def alert_context_node(state: WorkflowState) -> WorkflowState:
                 "related_context": {}
             }
         
-        # Store context in state
-        state.user_context["alert_context"] = alert_context
-        state.user_context["analysis_state"] = {
-            "status": "context_extracted",
-            "iterations": 0,
-            "findings": [],
-            "tools_used": []
-        }
-        
         print(f"[ALERT CONTEXT NODE] Context extracted: {alert_context.get('summary', 'No summary')}")
-        return state
+        
+        # Store context in state; user_context updates are merged
+        return {
+            "user_context": {"alert_context": alert_context},
+            "analysis_state": AlertAnalysisState(status="context_extracted")
+        }
         
     except Exception as e:
         print(f"[ALERT CONTEXT NODE] Error: {e}")
@@ -121,26 +127,56 @@ async def alert_context_node(state: WorkflowState) -> WorkflowState:
         raise
 
 
+def _analysis_command(
+    analysis_state: AlertAnalysisState,
+    context_update: Dict[str, Any]
+) -> Command[Literal["rag_search", "memory_aggregation", "alert_decision"]]:
+    """
+    Commit the analysis results and route to RAG, memory or the decision node.
+    
+    Only the user_context keys set by this iteration are written, so a cached
+    result never carries another run's context. When both RAG and memory are
+    needed they run in parallel; each updates its own user_context keys and
+    both lead back to alert_analysis.
+    """
+    rag_needed = context_update.get("rag_needed", False)
+    memory_needed = context_update.get("memory_needed", False)
+    if rag_needed and memory_needed:
+        goto = ["rag_search", "memory_aggregation"]
+    elif rag_needed:
+        goto = "rag_search"
+    elif memory_needed:
+        goto = "memory_aggregation"
+    else:
+        goto = "alert_decision"
+    return Command(
+        update={"user_context": context_update, "analysis_state": analysis_state},
+        goto=goto
+    )
+
+
 @observe(name="alert_analysis_mode_node")
-async def alert_analysis_mode_node(state: WorkflowState) -> WorkflowState:
+async def alert_analysis_mode_node(
+    state: AlertWorkflowState
+) -> Command[Literal["rag_search", "memory_aggregation", "alert_decision"]]:
     """Iterative alert analysis with tool selection and execution."""
     print(f"\n[ALERT ANALYSIS NODE] Starting analysis iteration...")
     
     llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
     
     alert_context = state.user_context.get("alert_context", {})
-    analysis_state = state.user_context.get("analysis_state", {})
+    analysis_state = state.analysis_state
     
     # Increment iteration counter
-    analysis_state["iterations"] += 1
+    analysis_state.iterations += 1
     
     # Prepare analysis prompt
     messages = [
         SystemMessage(content=ALERT_ANALYSIS_SYSTEM_PROMPT),
         HumanMessage(content=ALERT_ANALYSIS_USER_PROMPT.format(
             alert_context=safe_json_dumps(alert_context, indent=2),
-            current_analysis=safe_json_dumps(analysis_state.get("findings", []), indent=2),
-            previous_results=safe_json_dumps(analysis_state.get("last_results", {}), indent=2)
+            current_analysis=safe_json_dumps(analysis_state.findings, indent=2),
+            previous_results=safe_json_dumps(analysis_state.last_results, indent=2)
         ))
     ]
     
@@ -159,54 +195,78 @@ async def alert_analysis_mode_node(state: WorkflowState) -> WorkflowState:
     
     # If analysis is complete, update state and return
     if analysis_decision.get("analysis_status") == "analysis_complete":
-        analysis_state["status"] = "complete"
-        analysis_state["confidence_level"] = analysis_decision.get("confidence_level", 0)
-        state.user_context["analysis_state"] = analysis_state
-        return state
+        analysis_state.status = "complete"
+        analysis_state.confidence_level = analysis_decision.get("confidence_level", 0)
+        return _analysis_command(analysis_state, {})
     
-    # Execute tools based on decision
+    # Execute tools based on decision; the data source queries are independent
+    # so they run concurrently and the node waits for the slowest one only
     tool_results = {}
+    tool_calls = []
+    context_update = {}
     
     for tool_request in analysis_decision.get("next_tools", []):
         tool_name = tool_request.get("tool_name")
         
-        if tool_name == "prometheus":
-            results = await _execute_prometheus_queries(tool_request, alert_context)
-            tool_results["prometheus"] = results
-            
-        elif tool_name == "loki":
-            results = await _execute_loki_queries(tool_request, alert_context)
-            tool_results["loki"] = results
-            
-        elif tool_name == "alertmanager":
-            results = await _execute_alertmanager_queries(tool_request, alert_context)
-            tool_results["alertmanager"] = results
+        if tool_name in _TOOL_EXECUTORS:
+            tool_calls.append((
+                tool_name,
+                asyncio.wait_for(
+                    _TOOL_EXECUTORS[tool_name](tool_request, alert_context),
+                    timeout=TOOL_TIMEOUT_SECONDS
+                )
+            ))
             
         elif tool_name == "rag":
             # RAG will be handled by a separate node
-            state.user_context["rag_needed"] = True
-            state.user_context["rag_request"] = tool_request
+            context_update["rag_needed"] = True
+            context_update["rag_request"] = tool_request
             
         elif tool_name == "memory":
             # Memory will be handled by a separate node
-            state.user_context["memory_needed"] = True
-            state.user_context["memory_request"] = tool_request
+            context_update["memory_needed"] = True
+            context_update["memory_request"] = tool_request
+    
+    if tool_calls:
+        outcomes = await asyncio.gather(*(call for _, call in tool_calls), return_exceptions=True)
+        for (tool_name, _), outcome in zip(tool_calls, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                print(f"[ALERT ANALYSIS NODE] {tool_name} timed out after {TOOL_TIMEOUT_SECONDS}s")
+                outcome = {"error": f"{tool_name} query timed out"}
+            elif isinstance(outcome, Exception):
+                print(f"[ALERT ANALYSIS NODE] {tool_name} failed: {outcome}")
+                outcome = {"error": str(outcome)}
+            tool_results[tool_name] = outcome
     
     # Update analysis state with results
-    analysis_state["last_results"] = tool_results
-    analysis_state["findings"].extend(analysis_decision.get("findings", []))
-    analysis_state["tools_used"].extend([t["tool_name"] for t in analysis_decision.get("next_tools", [])])
+    analysis_state.last_results = tool_results
+    analysis_state.findings.extend(analysis_decision.get("findings", []))
+    analysis_state.tools_used.extend([t["tool_name"] for t in analysis_decision.get("next_tools", [])])
     
     # Check if we've hit iteration limit
-    if analysis_state["iterations"] >= 5:
+    if analysis_state.iterations >= 5:
         print("[ALERT ANALYSIS NODE] Hit iteration limit, forcing completion")
-        analysis_state["status"] = "complete"
+        analysis_state.status = "complete"
     
-    state.user_context["analysis_state"] = analysis_state
-    state.user_context["tool_results"] = tool_results
+    context_update["tool_results"] = tool_results
     
-    print(f"[ALERT ANALYSIS NODE] Iteration {analysis_state['iterations']} complete")
-    return state
+    print(f"[ALERT ANALYSIS NODE] Iteration {analysis_state.iterations} complete")
+    return _analysis_command(analysis_state, context_update)
+
+
+async def _run_prometheus_query(
+    query: str,
+    method: Callable[[Any], Awaitable[Any]],
+    make_request: Callable[..., Any],
+    slots: asyncio.Semaphore
+) -> Any:
+    """Build and run one Prometheus query while holding one of the batch's slots."""
+    async with slots:
+        try:
+            return await method(make_request(query=query))
+        except Exception as e:
+            print(f"[PROMETHEUS] Query failed: {query} - Error: {e}")
+            return {"error": str(e)}
 
 
 async def _execute_prometheus_queries(tool_request: Dict, alert_context: Dict) -> Dict:
@@ -219,6 +279,8 @@ async def _execute_prometheus_queries(tool_request: Dict, alert_context: Dict) -
     start_time = end_time - timedelta(hours=query_params.get("hours", 1))
     
     results = {}
+    # Created per batch so the semaphore binds to the running event loop
+    slots = asyncio.Semaphore(PROMETHEUS_MAX_CONCURRENT_QUERIES)
     
     from tools.prometheus.models import PrometheusRangeQueryRequest, PrometheusQueryRequest
     
@@ -246,20 +308,18 @@ async def _execute_prometheus_queries(tool_request: Dict, alert_context: Dict) -
         else:
             queries_to_execute = metrics
             
-        # Execute queries
-        for query in queries_to_execute:
-            try:
-                request = PrometheusRangeQueryRequest(
-                    query=query,
-                    start=str(int(start_time.timestamp())),
-                    end=str(int(end_time.timestamp())),
-                    step="1m"
-                )
-                result = await prometheus.query_range(request)
-                results[query] = result
-            except Exception as e:
-                print(f"[PROMETHEUS] Query failed: {query} - Error: {e}")
-                results[query] = {"error": str(e)}
+        # Execute queries concurrently
+        make_request = functools.partial(
+            PrometheusRangeQueryRequest,
+            start=str(int(start_time.timestamp())),
+            end=str(int(end_time.timestamp())),
+            step="1m"
+        )
+        outcomes = await asyncio.gather(*(
+            _run_prometheus_query(query, prometheus.query_range, make_request, slots)
+            for query in queries_to_execute
+        ))
+        results.update(zip(queries_to_execute, outcomes))
     
     elif query_params.get("query_type") == "instant":
         queries = query_params.get("queries", [])
@@ -268,14 +328,11 @@ async def _execute_prometheus_queries(tool_request: Dict, alert_context: Dict) -
             instance = alert_context.get("affected_components", [None])[0]
             queries = [f'up{{instance="{instance}"}}'] if instance else ['up']
             
-        for query in queries:
-            try:
-                request = PrometheusQueryRequest(query=query)
-                result = await prometheus.query(request)
-                results[query] = result
-            except Exception as e:
-                print(f"[PROMETHEUS] Query failed: {query} - Error: {e}")
-                results[query] = {"error": str(e)}
+        outcomes = await asyncio.gather(*(
+            _run_prometheus_query(query, prometheus.query, PrometheusQueryRequest, slots)
+            for query in queries
+        ))
+        results.update(zip(queries, outcomes))
     
     return reduce_data_for_context(results, max_chars=10000)
 
@@ -347,13 +404,21 @@ async def _execute_alertmanager_queries(tool_request: Dict, alert_context: Dict)
     return reduce_data_for_context(results, max_chars=8000)
 
 
+# Data source executors that alert_analysis_mode_node runs concurrently
+_TOOL_EXECUTORS = {
+    "prometheus": _execute_prometheus_queries,
+    "loki": _execute_loki_queries,
+    "alertmanager": _execute_alertmanager_queries
+}
+
+
 @observe(name="rag_search_node")
-async def rag_search_node(state: WorkflowState) -> WorkflowState:
+async def rag_search_node(state: AlertWorkflowState) -> Dict[str, Any]:
     """Search documentation using RAG."""
     print(f"\n[RAG SEARCH NODE] Searching documentation...")
     
     if not state.user_context.get("rag_needed", False):
-        return state
+        return {}
     
     llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
     rag_service = RAGService()
@@ -396,21 +461,20 @@ async def rag_search_node(state: WorkflowState) -> WorkflowState:
                 result["search_intent"] = search_item["intent"]
                 all_results.append(result)
     
-    # Store results
-    state.user_context["rag_results"] = all_results
-    state.user_context["rag_needed"] = False
-    
     print(f"[RAG SEARCH NODE] Found {len(all_results)} relevant documents")
-    return state
+    
+    # Store results; only this node's keys are returned so a concurrent
+    # memory aggregation can update user_context in the same step
+    return {"user_context": {"rag_results": all_results, "rag_needed": False}}
 
 
 @observe(name="memory_aggregation_node")
-async def memory_aggregation_node(state: WorkflowState) -> WorkflowState:
+async def memory_aggregation_node(state: AlertWorkflowState) -> Dict[str, Any]:
     """Aggregate memories from multiple sources."""
     print(f"\n[MEMORY AGGREGATION NODE] Fetching historical context...")
     
     if not state.user_context.get("memory_needed", False):
-        return state
+        return {}
     
     memory_service = MemoryService()
     alert_context = state.user_context.get("alert_context", {})
@@ -471,17 +535,16 @@ async def memory_aggregation_node(state: WorkflowState) -> WorkflowState:
                 unique_memories.append(memory)
         all_memories[source] = unique_memories[:10]  # Keep top 10 per source
     
-    # Store results
-    state.user_context["memory_results"] = all_memories
-    state.user_context["memory_needed"] = False
-    
     total_memories = sum(len(memories) for memories in all_memories.values())
     print(f"[MEMORY AGGREGATION NODE] Found {total_memories} relevant memories")
-    return state
+    
+    # Store results; only this node's keys are returned so a concurrent
+    # RAG search can update user_context in the same step
+    return {"user_context": {"memory_results": all_memories, "memory_needed": False}}
 
 
 @observe(name="alert_decision_node")
-async def alert_decision_node(state: WorkflowState) -> WorkflowState:
+async def alert_decision_node(state: AlertWorkflowState) -> Command[Literal["alert_analysis", "alert_result"]]:
     """Decide if analysis is sufficient or needs more data."""
     print(f"\n[ALERT DECISION NODE] Evaluating analysis completeness...")
     
@@ -490,24 +553,30 @@ async def alert_decision_node(state: WorkflowState) -> WorkflowState:
     # Gather all analysis data
     alert_data = state.user_context.get("alert_data", {})
     alert_context = state.user_context.get("alert_context", {})
-    analysis_state = state.user_context.get("analysis_state", {})
+    analysis_state = state.analysis_state
     tool_results = state.user_context.get("tool_results", {})
     rag_results = state.user_context.get("rag_results", [])
     memory_results = state.user_context.get("memory_results", {})
     
     # Check if we've hit iteration limits or have minimal data
-    iterations = analysis_state.get("iterations", 0)
+    iterations = analysis_state.iterations
     has_data = bool(tool_results or rag_results or memory_results)
     
+    # A loop that no longer advances, or one close to the recursion limit,
+    # is finished here rather than failing with GraphRecursionError
+    stalled = iterations <= analysis_state.decided_iteration
+    near_limit = state.remaining_steps < 5
+    analysis_state.decided_iteration = iterations
+    
     # Force completion if we've exhausted iterations or have no data sources
-    if iterations >= 5 or (iterations >= 3 and not has_data):
-        print(f"[ALERT DECISION NODE] Forcing completion - iterations: {iterations}, has_data: {has_data}")
+    if iterations >= 5 or (iterations >= 3 and not has_data) or stalled or near_limit:
+        print(f"[ALERT DECISION NODE] Forcing completion - iterations: {iterations}, has_data: {has_data}, stalled: {stalled}, remaining_steps: {state.remaining_steps}")
         decision = {
             "decision": "proceed_to_results",
             "confidence_score": 60 if has_data else 40,
             "reasoning": "Analysis completed with available data" if has_data else "Limited data available, proceeding with basic analysis",
             "gaps_identified": ["Limited external data sources available"] if not has_data else [],
-            "key_findings": analysis_state.get("findings", []),
+            "key_findings": analysis_state.findings,
             "root_cause_identified": False,
             "impact_assessment": "Unable to fully assess impact due to limited data"
         }
@@ -518,7 +587,7 @@ async def alert_decision_node(state: WorkflowState) -> WorkflowState:
             HumanMessage(content=ALERT_DECISION_USER_PROMPT.format(
                 original_alert=safe_json_dumps(alert_data, indent=2),
                 alert_context=safe_json_dumps(alert_context, indent=2),
-                analysis_results=safe_json_dumps(analysis_state.get("findings", []), indent=2),
+                analysis_results=safe_json_dumps(analysis_state.findings, indent=2),
                 metrics_data=safe_json_dumps(tool_results.get("prometheus", {}), indent=2)[:5000],
                 logs_data=safe_json_dumps(tool_results.get("loki", {}), indent=2)[:5000],
                 alert_history=safe_json_dumps(tool_results.get("alertmanager", {}), indent=2)[:3000],
@@ -552,25 +621,29 @@ async def alert_decision_node(state: WorkflowState) -> WorkflowState:
     # Update analysis state based on decision
     if decision.get("decision") == "need_more_analysis" and iterations < 5:
         # Reset for another iteration
-        state.user_context["analysis_state"]["status"] = "needs_more_data"
+        analysis_state.status = "needs_more_data"
         
         # Add specific data request if provided
         if decision.get("additional_data_needed"):
-            state.user_context["analysis_state"]["last_results"] = {
+            analysis_state.last_results = {
                 "decision_feedback": decision.get("additional_data_needed")
             }
     else:
         # Mark as complete
-        state.user_context["analysis_state"]["status"] = "complete"
+        analysis_state.status = "complete"
         state.user_context["key_findings"] = decision.get("key_findings", [])
         state.user_context["root_cause"] = decision.get("reasoning", "")
     
     print(f"[ALERT DECISION NODE] Decision: {decision.get('decision')} (Confidence: {decision.get('confidence_score')}%)")
-    return state
+    goto = "alert_analysis" if decision.get("decision") == "need_more_analysis" else "alert_result"
+    return Command(
+        update={"user_context": state.user_context, "analysis_state": state.analysis_state},
+        goto=goto
+    )
 
 
 @observe(name="alert_result_node")
-async def alert_result_node(state: WorkflowState) -> WorkflowState:
+async def alert_result_node(state: AlertWorkflowState) -> Dict[str, Any]:
     """Generate final alert analysis report."""
     print(f"\n[ALERT RESULT NODE] Generating final report...")
     
@@ -579,7 +652,7 @@ async def alert_result_node(state: WorkflowState) -> WorkflowState:
     # Gather all information for the report
     alert_data = state.user_context.get("alert_data", {})
     alert_context = state.user_context.get("alert_context", {})
-    analysis_state = state.user_context.get("analysis_state", {})
+    analysis_state = state.analysis_state
     tool_results = state.user_context.get("tool_results", {})
     rag_results = state.user_context.get("rag_results", [])
     memory_results = state.user_context.get("memory_results", {})
@@ -592,10 +665,10 @@ async def alert_result_node(state: WorkflowState) -> WorkflowState:
             original_alert=safe_json_dumps(alert_data, indent=2),
             alert_context=safe_json_dumps(alert_context, indent=2),
             analysis_results=safe_json_dumps({
-                "findings": analysis_state.get("findings", []),
-                "tools_used": analysis_state.get("tools_used", []),
-                "iterations": analysis_state.get("iterations", 0),
-                "confidence_level": analysis_state.get("confidence_level", 0)
+                "findings": analysis_state.findings,
+                "tools_used": analysis_state.tools_used,
+                "iterations": analysis_state.iterations,
+                "confidence_level": analysis_state.confidence_level
             }, indent=2),
             key_findings=safe_json_dumps(state.user_context.get("key_findings", []), indent=2),
             root_cause=state.user_context.get("root_cause", "Not definitively identified")
@@ -606,20 +679,22 @@ async def alert_result_node(state: WorkflowState) -> WorkflowState:
     
     # Store the markdown report
     markdown_report = response.content
-    state.final_result = {
-        "answer": markdown_report,
-        "type": "alert_analysis"
-    }
-    state.user_context["alert_report"] = {
-        "markdown": markdown_report,
-        "generated_at": datetime.now().isoformat(),
-        "alert_id": alert_data.get("alert_id", "unknown"),
-        "severity": alert_context.get("severity", "unknown"),
-        "confidence_score": decision.get("confidence_score", 0)
-    }
-    
-    # Mark workflow as complete
-    state.user_context["workflow_status"] = "completed"
     
     print(f"[ALERT RESULT NODE] Report generated ({len(markdown_report)} characters)")
-    return state
\ No newline at end of file
+    return {
+        "final_result": {
+            "answer": markdown_report,
+            "type": "alert_analysis"
+        },
+        "user_context": {
+            "alert_report": {
+                "markdown": markdown_report,
+                "generated_at": datetime.now().isoformat(),
+                "alert_id": alert_data.get("alert_id", "unknown"),
+                "severity": alert_context.get("severity", "unknown"),
+                "confidence_score": decision.get("confidence_score", 0)
+            },
+            # Mark workflow as complete
+            "workflow_status": "completed"
+        }
+    }
\ No newline at end of file
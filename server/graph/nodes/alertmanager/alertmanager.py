@@ -7,8 +7,9 @@ based on requests from query, action, or incident nodes.
 
 import logging
 import json
+from datetime import datetime
 from typing import Dict, Any, List
-from langfuse import observe
+from utils.tracing import observe
 
 from ...state import WorkflowState, update_state_node
 from llm.openai import openai
@@ -192,7 +193,6 @@ class AlertmanagerNode:
                 collected_data["metadata"][f"{tool_name}_error"] = str(e)
         
         # Add metadata
-        from datetime import datetime
         collected_data["metadata"]["collection_timestamp"] = datetime.now().isoformat()
         
         # Calculate summary statistics
@@ -8,7 +8,7 @@ and categorizes it into Query, Incident, or Action workflow types.
 import json
 import logging
 from typing import Dict, Any
-from langfuse import observe
+from utils.tracing import observe
 
 from ..state import WorkflowState, CategorizationResult, NodeResult, update_state_node
 from llm.openai import openai
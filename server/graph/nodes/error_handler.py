@@ -8,7 +8,7 @@ workflow errors and provides appropriate error responses.
 import logging
 from datetime import datetime
 from typing import Dict, Any
-from langfuse import observe
+from utils.tracing import observe
 
 from ..state import WorkflowState, update_state_node, finalize_state
 
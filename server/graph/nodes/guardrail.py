@@ -9,7 +9,7 @@ with a static response.
 import json
 import logging
 from typing import Dict, Any, Optional, List
-from langfuse import observe
+from utils.tracing import observe
 
 from ..state import WorkflowState, update_state_node, finalize_state, set_error
 from llm.openai import openai
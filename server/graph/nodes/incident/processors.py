@@ -5,7 +5,9 @@ Processors for incident node - handles data processing and prometheus result han
 import json
 import logging
 from typing import Dict, Any
-from langfuse import observe
+
+import orjson
+from utils.tracing import observe
 from llm.openai import openai
 from prompts.data_collection.incident_prompts import get_incident_prompt
 from prompts.workflows.processor_prompts import get_processor_system_prompt
@@ -77,7 +79,7 @@ async def process_prometheus_result(state: WorkflowState, prometheus_data: Dict[
             reduced_size = data_reducer.estimate_tokens(reduced_alerts)
             logger.info(f"Reduced Alertmanager data from ~{original_size} to ~{reduced_size} tokens")
         
-        data_for_prompt = json.dumps(collected_data, indent=2)
+        data_for_prompt = json.dumps(collected_data, separators=(",", ":"))
 
         # Use incident investigation prompt for detailed analysis
         investigation_prompt = get_incident_prompt(
@@ -95,11 +97,11 @@ async def process_prometheus_result(state: WorkflowState, prometheus_data: Dict[
         if not investigation_response["success"]:
             raise Exception(investigation_response.get("error", "OpenAI request failed"))
 
-        investigation_result = json.loads(investigation_response["content"])
+        investigation_result = orjson.loads(investigation_response["content"])
         
         # Now create the final incident report
         # Use the same truncated data for consistency
-        timeline_str = json.dumps(timeline, indent=2)
+        timeline_str = json.dumps(timeline, separators=(",", ":"))
         if len(timeline_str) > 5000:  # Limit timeline data too
             timeline_str = timeline_str[:5000] + "\n... [Timeline truncated]"
 
@@ -122,8 +124,8 @@ async def process_prometheus_result(state: WorkflowState, prometheus_data: Dict[
 
         # Parse JSON response with better error handling
         try:
-            report_result = json.loads(report_response["content"])
-        except json.JSONDecodeError as e:
+            report_result = orjson.loads(report_response["content"])
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse OpenAI response as JSON: {str(e)}")
             logger.error(f"Response content: {report_response['content'][:500]}...")  # Log first 500 chars
             # Return a fallback response
@@ -263,10 +265,10 @@ async def process_loki_result(state: WorkflowState, loki_data: Dict[str, Any], n
         prompt = get_incident_prompt(
             "output_formatting",
             user_input=state.user_input,
-            collected_data=json.dumps(collected_data, indent=2),
+            collected_data=json.dumps(collected_data, separators=(",", ":")),
             incident_type=incident_type,
             severity=severity,
-            timeline=json.dumps(combined_timeline, indent=2)
+            timeline=json.dumps(combined_timeline, separators=(",", ":"))
         )
 
         response = await openai.chat_completion(
@@ -278,7 +280,7 @@ async def process_loki_result(state: WorkflowState, loki_data: Dict[str, Any], n
         if not response["success"]:
             raise Exception(response.get("error", "OpenAI request failed"))
 
-        result = json.loads(response["content"])
+        result = orjson.loads(response["content"])
 
         # Set incident result and route to output
         state.metadata["incident_result"] = result
@@ -7,8 +7,10 @@ based on requests from query, action, or incident nodes.
 
 import logging
 import json
+import time
+from datetime import datetime, timedelta
 from typing import Dict, Any
-from langfuse import observe
+from utils.tracing import observe
 
 from ...state import WorkflowState, update_state_node
 from llm.openai import openai
@@ -119,8 +121,6 @@ class LokiNode:
         """
         # Import Loki tools
         from tools.loki import loki, LokiQueryRequest, LokiRangeQueryRequest
-        import time
-        from datetime import datetime, timedelta
         
         def convert_time_to_ns(time_param: str) -> str:
             """Convert time parameter to Unix nanoseconds."""
@@ -9,7 +9,7 @@ import json
 import logging
 from typing import Dict, Any
 from datetime import datetime
-from langfuse import observe
+from utils.tracing import observe
 
 from prompts.workflows.tool_decision import get_tool_decision_prompt
 from llm.openai import openai
@@ -9,7 +9,7 @@ import json
 import logging
 from typing import Dict, Any
 from datetime import datetime
-from langfuse import observe
+from utils.tracing import observe
 
 from prompts.workflows.processing import get_action_query_processing_prompt, get_incident_processing_prompt
 from llm.openai import openai
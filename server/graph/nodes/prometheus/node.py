@@ -6,7 +6,7 @@ using tools from server/tools/prometheus/ and processes data according to user r
 """
 
 import logging
-from langfuse import observe
+from utils.tracing import observe
 
 from ...state import WorkflowState, update_state_node
 from .data_collector import data_collector
@@ -8,7 +8,7 @@ pattern matching for common queries and AI-driven query generation.
 import json
 import logging
 from typing import Dict, Any, Optional, List
-from langfuse import observe
+from utils.tracing import observe
 
 from prompts.workflows.planning import get_planning_prompt
 from prompts.workflows.tool_decision import get_tool_decision_prompt
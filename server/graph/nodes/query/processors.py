@@ -5,7 +5,9 @@ Processors for query node - handles data processing and prometheus result handli
 import json
 import logging
 from typing import Dict, Any
-from langfuse import observe
+
+import orjson
+from utils.tracing import observe
 from llm.openai import openai
 from prompts.data_collection.query_prompts import get_query_prompt
 from prompts.workflows.processor_prompts import get_processor_system_prompt
@@ -49,7 +51,7 @@ async def process_prometheus_result(state: WorkflowState, prometheus_data: Dict[
         prompt = get_query_prompt(
             "output_formatting",
             user_input=state.user_input,
-            collected_data=json.dumps(reduced_data, indent=2),
+            collected_data=json.dumps(reduced_data, separators=(",", ":")),
             data_sources="Prometheus"
         )
 
@@ -64,8 +66,8 @@ async def process_prometheus_result(state: WorkflowState, prometheus_data: Dict[
 
         # Parse JSON response with better error handling
         try:
-            result = json.loads(response["content"])
-        except json.JSONDecodeError as e:
+            result = orjson.loads(response["content"])
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse OpenAI response as JSON: {str(e)}")
             logger.error(f"Response content: {response['content'][:500]}...")  # Log first 500 chars
             # Return a fallback response
@@ -179,7 +181,7 @@ async def process_loki_result(state: WorkflowState, loki_data: Dict[str, Any], n
         prompt = get_query_prompt(
             "output_formatting",
             user_input=state.user_input,
-            collected_data=json.dumps(collected_data, indent=2),
+            collected_data=json.dumps(collected_data, separators=(",", ":")),
             data_sources=", ".join(data_sources)
         )
 
@@ -192,7 +194,7 @@ async def process_loki_result(state: WorkflowState, loki_data: Dict[str, Any], n
         if not response["success"]:
             raise Exception(response.get("error", "OpenAI request failed"))
 
-        result = json.loads(response["content"])
+        result = orjson.loads(response["content"])
         
         logger.info(f"Query result formatted with keys: {list(result.keys())}")
 
@@ -7,7 +7,7 @@ and routes metrics-related requests to the prometheus node.
 
 import logging
 from typing import Dict, Any
-from langfuse import observe
+from utils.tracing import observe
 
 from ...state import WorkflowState, update_state_node
 from .analyzers import analyze_data_requirements, process_non_metrics_query
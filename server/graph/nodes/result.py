@@ -9,7 +9,7 @@ import logging
 import json
 from datetime import datetime
 from typing import Dict, Any, Optional
-from langfuse import observe
+from utils.tracing import observe
 
 from ..state import WorkflowState, update_state_node, finalize_state
 from llm.openai import openai
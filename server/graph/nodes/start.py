@@ -8,7 +8,7 @@ and prepares the state for processing.
 import logging
 from datetime import datetime
 from typing import Optional
-from langfuse import observe
+from utils.tracing import observe
 
 from ..state import WorkflowState, update_state_node
 
@@ -41,7 +41,9 @@ from .enums import (
 from .models import (
     CategorizationResult,
     NodeResult,
+    AlertAnalysisState,
     WorkflowState,
+    AlertWorkflowState,
     GraphConfig
 )
 
@@ -71,7 +73,9 @@ __all__ = [
     # Models
     "CategorizationResult",
     "NodeResult",
+    "AlertAnalysisState",
     "WorkflowState",
+    "AlertWorkflowState",
     "GraphConfig",
     
     # Utility functions
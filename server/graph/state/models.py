@@ -5,13 +5,24 @@ This module defines the core data models used throughout the workflow
 system for state management, results, and configuration.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Annotated, Dict, List, Optional, Any
 from pydantic import BaseModel, Field, ConfigDict, field_serializer
 from datetime import datetime
+from langgraph.managed import RemainingSteps
 
 from .enums import WorkflowType, ComplexityLevel, NodeStatus, ExecutionPhase
 
 
+def merge_dicts(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    State reducer that shallow-merges a dict update into the current value.
+    
+    Lets nodes running in the same step each update their own keys of a
+    shared dict field instead of conflicting over the whole value.
+    """
+    return {**left, **right}
+
+
 class CategorizationResult(BaseModel):
     """
     Result of workflow categorization analysis.
@@ -54,6 +65,22 @@ class NodeResult(BaseModel):
     model_config = ConfigDict(use_enum_values=True)
 
 
+class AlertAnalysisState(BaseModel):
+    """
+    Progress of the iterative alert analysis loop.
+    
+    Kept as its own state field so the alert nodes read typed attributes
+    instead of walking nested user_context dicts.
+    """
+    status: str = Field(default="pending", description="Current analysis status")
+    iterations: int = Field(default=0, description="Number of analysis iterations run")
+    findings: List[Any] = Field(default_factory=list, description="Findings accumulated across iterations")
+    tools_used: List[str] = Field(default_factory=list, description="Tools requested across iterations")
+    last_results: Dict[str, Any] = Field(default_factory=dict, description="Tool results or feedback from the last iteration")
+    confidence_level: float = Field(default=0, description="Confidence reported when analysis completed")
+    decided_iteration: int = Field(default=-1, description="Iteration at which the decision node last ran")
+
+
 class WorkflowState(BaseModel):
     """
     Main state object for LangGraph workflow execution.
@@ -179,6 +206,25 @@ class WorkflowState(BaseModel):
         }
 
 
+class AlertWorkflowState(WorkflowState):
+    """
+    State schema of the alert analysis graph.
+    
+    rag_search and memory_aggregation run in the same step and each write
+    their own user_context keys, so user_context is merged instead of
+    replaced. Other workflows keep the plain replace semantics. The
+    analysis loop progress lives here too, so other workflows never
+    checkpoint it, and the loop reads remaining_steps to finish before the
+    recursion limit.
+    """
+    user_context: Annotated[Dict[str, Any], merge_dicts] = Field(default_factory=dict, description="User-specific context information")
+    analysis_state: AlertAnalysisState = Field(default_factory=AlertAnalysisState, description="Alert analysis loop progress")
+    
+    # Managed value filled in by LangGraph for every node call with the steps
+    # left before the recursion limit; it is never part of the run input
+    remaining_steps: RemainingSteps
+
+
 class GraphConfig(BaseModel):
     """
     Configuration for LangGraph workflow execution.
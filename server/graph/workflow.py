@@ -7,11 +7,11 @@ for categorizing user input and routing to appropriate handlers.
 
 import logging
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, AsyncIterator
 from datetime import datetime
 
 from langgraph.graph import StateGraph, END
-from langfuse import observe
+from utils.tracing import observe
 
 from .state import WorkflowState, GraphConfig, create_initial_state
 from checkpointing import get_checkpointer
@@ -401,7 +401,8 @@ class PaladinWorkflow:
     async def stream(
         self,
         user_input: str,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        stream_tokens: bool = False
     ):
         """
         Stream workflow execution for real-time updates.
@@ -410,9 +411,10 @@ class PaladinWorkflow:
             user_input: The user's input/query to process
             session_id: Optional session identifier for tracking
             config: Optional execution configuration
+            stream_tokens: Also yield partial LLM output as {"partial_output": ...}
             
         Yields:
-            Workflow state updates as they occur
+            Workflow state updates, plus partial LLM output if requested
         """
         logger.info(f"Streaming workflow for input: {user_input[:100]}...")
         
@@ -429,13 +431,16 @@ class PaladinWorkflow:
                 )
                 logger.debug(f"Using checkpoint config for streaming session: {session_id}")
             
-            # Stream workflow execution with or without checkpointing
+            # Partial LLM output written by nodes is opt-in and wrapped so
+            # update consumers can tell it apart
+            stream_mode = ["updates", "custom"] if stream_tokens else ["updates"]
             if config:
-                async for state in self.graph.astream(initial_state, config=config):
-                    yield state
+                stream = self.graph.astream(initial_state, config=config, stream_mode=stream_mode)
             else:
-                async for state in self.graph.astream(initial_state):
-                    yield state
+                stream = self.graph.astream(initial_state, stream_mode=stream_mode)
+            
+            async for mode, chunk in stream:
+                yield chunk if mode == "updates" else {"partial_output": chunk}
                     
         except Exception as e:
             error_msg = f"Workflow streaming failed: {str(e)}"
@@ -492,6 +497,24 @@ error_handler ←
             checkpoint_ns=""  # LangGraph uses empty namespace by default
         )
     
+    async def checkpoint_exists(self, session_id: str) -> bool:
+        """
+        Check whether a checkpoint exists for a session.
+        
+        Args:
+            session_id: Session identifier
+        
+        Returns:
+            True if a checkpoint exists, False otherwise
+        """
+        if not self.checkpointer or not self.checkpointer.enabled:
+            return False
+        
+        return await self.checkpointer.checkpoint_exists(
+            thread_id=session_id,
+            checkpoint_ns=""  # LangGraph uses empty namespace by default
+        )
+    
     async def list_checkpoints(self, session_id: Optional[str] = None, limit: int = 10) -> list:
         """
         List available checkpoints.
@@ -512,6 +535,27 @@ error_handler ←
             limit=limit
         )
     
+    async def iter_checkpoints(self, session_id: str, limit: int = 10) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream checkpoints for a session, newest first.
+        
+        Args:
+            session_id: Session identifier
+            limit: Maximum number of checkpoints to yield
+            
+        Yields:
+            Checkpoint data with its config, metadata and parent config
+        """
+        if not self.checkpointer or not self.checkpointer.enabled:
+            return
+        
+        async for checkpoint in self.checkpointer.iter_checkpoints(
+            thread_id=session_id,
+            checkpoint_ns="",  # LangGraph uses empty namespace by default
+            limit=limit
+        ):
+            yield checkpoint
+    
     async def delete_checkpoint(self, session_id: str) -> bool:
         """
         Delete checkpoints for a session.
@@ -4,10 +4,11 @@ Handles OpenAI API calls with system prompts and environment configuration.
 """
 
 import os
-from typing import Dict, List, Optional, Any
-from openai import AsyncOpenAI
+from typing import AsyncIterator, Dict, List, Optional, Any
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from dotenv import load_dotenv
-from langfuse import observe
+from utils.tracing import observe
 
 # Import system prompts
 from prompts.system import SYSTEM_PROMPT
@@ -15,6 +16,9 @@ from prompts.system import SYSTEM_PROMPT
 # Load environment variables
 load_dotenv()
 
+# JSON mode enforced by the API, so prompts need no "answer in json" instructions
+JSON_OBJECT_FORMAT = {"type": "json_object"}
+
 
 class OpenAIService:
     """Service class for handling OpenAI API calls with system prompts."""
@@ -30,13 +34,27 @@ class OpenAIService:
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY environment variable is required")
         
-        # Initialize async OpenAI client
-        client_kwargs = {"api_key": self.api_key}
+        # Initialize async OpenAI client; one long-lived HTTP/2 pool is shared by
+        # every call so requests reuse connections instead of new TLS handshakes
+        client_kwargs = {
+            "api_key": self.api_key,
+            "http_client": DefaultAsyncHttpxClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=int(os.getenv("OPENAI_MAX_CONNECTIONS", "100")),
+                    max_keepalive_connections=int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+                )
+            )
+        }
         if self.base_url:
             client_kwargs["base_url"] = self.base_url
             
         self.client = AsyncOpenAI(**client_kwargs)
     
+    async def close(self) -> None:
+        """Close the shared HTTP connection pool."""
+        await self.client.close()
+    
     @observe(name="openai_chat_completion")
     async def chat_completion(
         self,
@@ -45,7 +63,8 @@ class OpenAIService:
         model: Optional[str] = None,
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
-        additional_context: Optional[Dict[str, Any]] = None
+        additional_context: Optional[Dict[str, Any]] = None,
+        response_format: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Make a chat completion request to OpenAI API.
@@ -57,6 +76,7 @@ class OpenAIService:
             max_tokens: Maximum tokens for response
             temperature: Temperature for response generation
             additional_context: Additional context to include in the prompt
+            response_format: OpenAI response format (defaults to JSON object mode)
             
         Returns:
             Dict containing the response and metadata
@@ -87,7 +107,7 @@ class OpenAIService:
                 messages=messages,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                response_format={"type": "json_object"}  # Force JSON response
+                response_format=response_format or JSON_OBJECT_FORMAT
             )
             
             # Extract response content
@@ -112,6 +132,49 @@ class OpenAIService:
                 "content": None
             }
 
+    @observe(name="openai_chat_completion_stream")
+    async def chat_completion_stream(
+        self,
+        user_message: str,
+        system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a JSON chat completion from OpenAI API.
+        
+        Unlike chat_completion, errors are raised to the caller rather than
+        returned, since content may already have been yielded.
+        
+        Args:
+            user_message: The user's message/query
+            system_prompt: Custom system prompt (defaults to SYSTEM_PROMPT)
+            model: Model to use (defaults to configured model)
+            max_tokens: Maximum tokens for response
+            temperature: Temperature for response generation
+            response_format: OpenAI response format (defaults to JSON object mode)
+            
+        Yields:
+            Content deltas as they arrive
+        """
+        stream = await self.client.chat.completions.create(
+            model=model or self.model,
+            messages=[
+                {"role": "system", "content": system_prompt or SYSTEM_PROMPT},
+                {"role": "user", "content": user_message}
+            ],
+            max_tokens=max_tokens or self.max_tokens,
+            temperature=temperature or self.temperature,
+            response_format=response_format or JSON_OBJECT_FORMAT,
+            stream=True
+        )
+        
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
     def _format_additional_context(self, context: Dict[str, Any]) -> str:
         """
         Format additional context into a readable string for the system prompt.
@@ -25,6 +25,7 @@ from middleware import ErrorHandlerMiddleware, RequestTimeoutMiddleware
 from memory.api import memory_router
 from graph.workflow import workflow
 from checkpointing import close_checkpointer
+from llm.openai import openai
 from checkpointing.routes import router as checkpoint_router
 
 # Suppress Pydantic deprecation warning from LangGraph
@@ -60,6 +61,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     print("Shutting down Paladin AI Server...")
     await close_checkpointer()
+    await openai.close()
     print("Cleanup completed")
 
 
@@ -256,6 +256,53 @@ Respond with JSON containing:
 - timestamp: when analysis was performed (IST format)
 """
 
+ACTION_METRICS_RESPONSE_PROMPT = """
+You are an expert SRE responding to an action request with collected monitoring data.
+
+User Request: {user_input}
+Categorization: {categorization_data}
+Collected Data: {collected_data}
+Data Sources: {data_sources}
+Report Period: {time_range}
+Action Type: {action_type}
+
+First choose the response type that best fits the user's request and categorization:
+1. "simple_data" - User wants specific metrics, values, or direct answers
+   - Examples: "what's the CPU usage?", "maximum memory usage", "current disk space"
+2. "comprehensive_analysis" - User wants detailed analysis, insights, or trends
+   - Examples: "analyze performance trends", "detailed analysis"
+3. "reporting" - User specifically wants a formatted report
+   - Examples: "create a report", "generate summary", "performance report"
+
+Then produce the formatted result for the chosen type from the collected data:
+- simple_data: response_type, action_type, data_response, supporting_metrics (REQUIRED - the actual
+  metric values requested with units, e.g. {{"average_cpu_usage": "45.2%", "maximum_memory_usage": "8.4GB"}}),
+  data_source, timestamp (IST format yyyy/mm/dd hh:mm:ss), confidence (0.0 to 1.0)
+- comprehensive_analysis: data_characteristics, trend_analysis, anomaly_detection, correlation_analysis,
+  performance_assessment, comparative_analysis, key_insights, recommendations
+- reporting: executive_summary, methodology, key_findings, detailed_analysis, visualization_recommendations,
+  recommendations, technical_appendix, report_metadata
+
+Always extract actual numerical values from processed_metrics, current_values, or raw data in the
+collected data rather than returning only recommendations.
+
+Respond with JSON containing:
+- response_type: "simple_data", "comprehensive_analysis", or "reporting"
+- formatted_result: object with the fields listed above for the chosen response type
+"""
+
+# Bound format methods, built once so each call is a lookup plus interpolation
+_ACTION_PROMPT_FORMATTERS = {
+    "data_collection": ACTION_DATA_COLLECTION_PROMPT.format,
+    "data_evaluation": ACTION_DATA_EVALUATION_PROMPT.format,
+    "output_formatting": ACTION_OUTPUT_FORMATTING_PROMPT.format,
+    "analysis": ACTION_ANALYSIS_PROMPT.format,
+    "reporting": ACTION_REPORTING_PROMPT.format,
+    "log_analysis": ACTION_LOG_ANALYSIS_PROMPT.format,
+    "combined_analysis": ACTION_COMBINED_ANALYSIS_PROMPT.format,
+    "metrics_response": ACTION_METRICS_RESPONSE_PROMPT.format
+}
+
 def get_action_prompt(prompt_type: str, **kwargs) -> str:
     """
     Get a formatted action workflow prompt.
@@ -267,21 +314,11 @@ def get_action_prompt(prompt_type: str, **kwargs) -> str:
     Returns:
         Formatted prompt string
     """
-    prompts = {
-        "data_collection": ACTION_DATA_COLLECTION_PROMPT,
-        "data_evaluation": ACTION_DATA_EVALUATION_PROMPT,
-        "output_formatting": ACTION_OUTPUT_FORMATTING_PROMPT,
-        "analysis": ACTION_ANALYSIS_PROMPT,
-        "reporting": ACTION_REPORTING_PROMPT,
-        "log_analysis": ACTION_LOG_ANALYSIS_PROMPT,
-        "combined_analysis": ACTION_COMBINED_ANALYSIS_PROMPT
-    }
-    
-    prompt_template = prompts.get(prompt_type)
-    if not prompt_template:
+    formatter = _ACTION_PROMPT_FORMATTERS.get(prompt_type)
+    if not formatter:
         raise ValueError(f"Unknown prompt type: {prompt_type}")
     
-    return prompt_template.format(**kwargs)
+    return formatter(**kwargs)
 
 def get_action_examples() -> str:
     """
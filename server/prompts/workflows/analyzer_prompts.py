@@ -70,6 +70,15 @@ Consider:
 - Actions involving alert management, silence creation need ONLY alert data
 - Only fetch multiple sources if the user explicitly requests correlation between them
 
+If the action needs NO external data (all three flags false), answer it directly in
+direct_response so no second request is needed:
+- response_type: "simple_data"
+- action_type: type of action performed
+- data_response: the complete answer to the user's request
+- recommendations: list of actionable follow-ups (may be empty)
+- confidence: float (0.0 to 1.0) indicating confidence in the response
+Otherwise set direct_response to null; it is produced after data collection.
+
 Response format (JSON):
 {{
     "needs_metrics": boolean,
@@ -82,10 +91,72 @@ Response format (JSON):
         "metrics": ["list of specific metrics if needed"],
         "logs": ["list of log types if needed"],
         "alerts": ["list of alert types if needed"]
+    }},
+    "direct_response": null | {{
+        "response_type": "simple_data",
+        "action_type": "string",
+        "data_response": "string",
+        "recommendations": ["string"],
+        "confidence": float
     }}
 }}
 """
 
+# Structured output schema matching the ACTION analyzer response format
+ACTION_ANALYZER_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "action_analysis",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "needs_metrics": {"type": "boolean"},
+                "needs_logs": {"type": "boolean"},
+                "needs_alerts": {"type": "boolean"},
+                "action_type": {"type": "string"},
+                "analysis_level": {"type": "string", "enum": ["basic", "intermediate", "comprehensive"]},
+                "reasoning": {"type": "string"},
+                "data_requirements": {
+                    "type": "object",
+                    "properties": {
+                        "metrics": {"type": "array", "items": {"type": "string"}},
+                        "logs": {"type": "array", "items": {"type": "string"}},
+                        "alerts": {"type": "array", "items": {"type": "string"}}
+                    },
+                    "required": ["metrics", "logs", "alerts"],
+                    "additionalProperties": False
+                },
+                "direct_response": {
+                    "anyOf": [
+                        {
+                            "type": "object",
+                            "properties": {
+                                "response_type": {"type": "string", "enum": ["simple_data"]},
+                                "action_type": {"type": "string"},
+                                "data_response": {"type": "string"},
+                                "recommendations": {"type": "array", "items": {"type": "string"}},
+                                "confidence": {"type": "number"}
+                            },
+                            "required": [
+                                "response_type", "action_type", "data_response",
+                                "recommendations", "confidence"
+                            ],
+                            "additionalProperties": False
+                        },
+                        {"type": "null"}
+                    ]
+                }
+            },
+            "required": [
+                "needs_metrics", "needs_logs", "needs_alerts", "action_type",
+                "analysis_level", "reasoning", "data_requirements", "direct_response"
+            ],
+            "additionalProperties": False
+        }
+    }
+}
+
 INCIDENT_ANALYZER_PROMPT = """Analyze this incident report to determine investigation requirements:
 
 Incident Description: {user_input}
@@ -13,20 +13,20 @@ QUERY_COMBINED_SYSTEM_PROMPT = """You are an expert SRE formatting query respons
 QUERY_NON_METRICS_SYSTEM_PROMPT = """You are an expert SRE providing direct answers to non-metrics queries. Always include the word 'json' in your response when using JSON format."""
 
 # Action processor prompts
-ACTION_NON_METRICS_SYSTEM_PROMPT = """You are an expert SRE handling non-metrics action requests. Always include the word 'json' in your response when using JSON format."""
+ACTION_NON_METRICS_SYSTEM_PROMPT = """You are an expert SRE handling non-metrics action requests."""
 
-ACTION_RESPONSE_TYPE_SYSTEM_PROMPT = """You are an expert SRE determining appropriate response types. Always include the word 'json' in your response when using JSON format."""
+ACTION_RESPONSE_TYPE_SYSTEM_PROMPT = """You are an expert SRE determining appropriate response types."""
 
-ACTION_METRICS_SYSTEM_PROMPT = """You are an expert SRE processing action results with metrics data. Always include the word 'json' in your response when using JSON format."""
+ACTION_METRICS_SYSTEM_PROMPT = """You are an expert SRE processing action results with metrics data."""
 
 # Action Loki processing prompts based on data availability
-ACTION_COMBINED_DATA_SYSTEM_PROMPT = """You are an expert SRE analyzing both logs and metrics data. Correlate the data types to provide comprehensive insights. Extract actual metric values and connect them with log events. Always include the word 'json' in your response when using JSON format."""
+ACTION_COMBINED_DATA_SYSTEM_PROMPT = """You are an expert SRE analyzing both logs and metrics data. Correlate the data types to provide comprehensive insights. Extract actual metric values and connect them with log events."""
 
-ACTION_LOGS_ONLY_SYSTEM_PROMPT = """You are an expert SRE analyzing log data. Focus on extracting meaningful insights from the logs. Always include the word 'json' in your response when using JSON format."""
+ACTION_LOGS_ONLY_SYSTEM_PROMPT = """You are an expert SRE analyzing log data. Focus on extracting meaningful insights from the logs."""
 
-ACTION_METRICS_ONLY_SYSTEM_PROMPT = """You are an expert SRE processing metrics data. Extract and return the actual numerical values. Always include the word 'json' in your response when using JSON format."""
+ACTION_METRICS_ONLY_SYSTEM_PROMPT = """You are an expert SRE processing metrics data. Extract and return the actual numerical values."""
 
-ACTION_GENERAL_SYSTEM_PROMPT = """You are an expert SRE processing monitoring data. Analyze all available data comprehensively. Always include the word 'json' in your response when using JSON format."""
+ACTION_GENERAL_SYSTEM_PROMPT = """You are an expert SRE processing monitoring data. Analyze all available data comprehensively."""
 
 # Incident processor prompts
 INCIDENT_INVESTIGATION_SYSTEM_PROMPT = """You are an expert SRE conducting incident investigation with metrics data. Always include the word 'json' in your response when using JSON format."""
@@ -8,6 +8,7 @@ import aiohttp
 import os
 
 from graph.alert_workflow import alert_workflow
+from graph.nodes.alert_analysis_nodes import safe_json_dumps
 
 router = APIRouter(prefix="/api/v1", tags=["alerts"])
 
@@ -191,7 +192,8 @@ async def analyze_alert_stream(request: AlertAnalysisRequest):
                     "session_id": session_id,
                     "event": event
                 }
-                yield f"data: {json.dumps(event_data)}\n\n"
+                # Update events carry pydantic models such as AlertAnalysisState
+                yield f"data: {safe_json_dumps(event_data)}\n\n"
                 
             # Send completion event
             yield f"data: {json.dumps({'session_id': session_id, 'status': 'completed'})}\n\n"
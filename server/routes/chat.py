@@ -58,12 +58,13 @@ async def chat_completion(request: ChatRequest) -> Dict[str, Any]:
 
 
 @router.post("/api/v1/chat/stream")
-async def chat_stream(request: ChatRequest) -> StreamingResponse:
+async def chat_stream(request: ChatRequest, stream_tokens: bool = False) -> StreamingResponse:
     """
     LangGraph workflow streaming endpoint.
 
     Accepts a message and streams the workflow execution in real-time,
-    returning state updates as they occur.
+    returning state updates as they occur. With ?stream_tokens=true, LLM
+    output is also streamed while it is generated, as {"partial_output": ...}.
     """
     import json
 
@@ -79,7 +80,8 @@ async def chat_stream(request: ChatRequest) -> StreamingResponse:
             # Stream the LangGraph workflow execution
             async for state_update in workflow.stream(
                 user_input=request.message,
-                session_id=session_id
+                session_id=session_id,
+                stream_tokens=stream_tokens
             ):
                 # Format state update as JSON
                 yield f"data: {json.dumps(state_update)}\n\n"
@@ -0,0 +1,10 @@
+"""
+Shared test configuration for the PaladinAI server.
+"""
+
+import os
+
+# Several modules build their clients at import time. Unit tests never reach
+# these services, but the settings have to be present.
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ.setdefault("ALERTMANAGER_URL", "http://localhost:9093")
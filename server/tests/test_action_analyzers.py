@@ -0,0 +1,29 @@
+"""
+Tests for the action requirement analyzers.
+"""
+
+import pytest
+
+from graph.nodes.action.analyzers import _LOG_KEYWORDS_RE
+
+
+@pytest.mark.parametrize("text", [
+    "show me the logs for api-server",
+    "any Log lines from nginx?",
+    "find the stack trace for the crash",
+    "enable debug output",
+    "Exception in payment service",
+    "check logging config",
+])
+def test_log_keywords_match_whole_words(text):
+    assert _LOG_KEYWORDS_RE.search(text)
+
+
+@pytest.mark.parametrize("text", [
+    "show the login latency",
+    "catalog service cpu usage",
+    "backlog of pending jobs",
+    "debugger attach count",
+])
+def test_log_keywords_ignore_words_containing_them(text):
+    assert _LOG_KEYWORDS_RE.search(text) is None
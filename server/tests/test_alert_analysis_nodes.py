@@ -0,0 +1,54 @@
+"""
+Tests for the alert analysis nodes.
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from graph.nodes import alert_analysis_nodes
+from graph.state import AlertAnalysisState
+
+
+@pytest.mark.asyncio
+async def test_prometheus_queries_run_concurrently_within_the_limit():
+    in_flight = []
+    peak = []
+
+    async def query(request):
+        in_flight.append(request.query)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(request.query)
+        if request.query == "broken":
+            raise RuntimeError("bad query")
+        return {"value": request.query}
+
+    queries = ["up", "broken", "node_load1", "node_load5"]
+    tool_request = {"query_params": {"query_type": "instant", "queries": queries}}
+
+    with patch.object(alert_analysis_nodes, "prometheus", MagicMock(query=query)), \
+         patch.object(alert_analysis_nodes, "PROMETHEUS_MAX_CONCURRENT_QUERIES", 2):
+        results = await alert_analysis_nodes._execute_prometheus_queries(tool_request, {})
+
+    assert list(results) == queries
+    assert results["broken"] == {"error": "bad query"}
+    assert results["node_load1"] == {"value": "node_load1"}
+    assert max(peak) == 2
+
+
+@pytest.mark.parametrize("rag_needed, memory_needed, goto", [
+    (True, True, ["rag_search", "memory_aggregation"]),
+    (True, False, "rag_search"),
+    (False, True, "memory_aggregation"),
+    (False, False, "alert_decision"),
+])
+def test_analysis_command_fans_out_to_needed_lookups(rag_needed, memory_needed, goto):
+    context_update = {"rag_needed": rag_needed, "memory_needed": memory_needed}
+    analysis_state = AlertAnalysisState(iterations=1)
+
+    command = alert_analysis_nodes._analysis_command(analysis_state, context_update)
+
+    assert command.goto == goto
+    assert command.update == {"user_context": context_update, "analysis_state": analysis_state}
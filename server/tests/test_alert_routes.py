@@ -0,0 +1,31 @@
+"""
+Tests for the alert analysis routes.
+"""
+
+import json
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from graph.state import AlertAnalysisState
+from routes import alerts
+
+
+def test_stream_serializes_state_models_in_update_events():
+    async def stream(alert_data, config=None):
+        yield {"alert_context": {"analysis_state": AlertAnalysisState(status="context_extracted")}}
+
+    app = FastAPI()
+    app.include_router(alerts.router)
+
+    with patch.object(alerts.alert_workflow, "stream", stream):
+        response = TestClient(app).post(
+            alerts.router.prefix + "/alert-analysis-mode/stream",
+            json={"alert_data": {"labels": {"alertname": "HighCPU"}}, "session_id": "s1"}
+        )
+
+    events = [json.loads(line[len("data: "):]) for line in response.text.splitlines() if line]
+    update = events[0]["event"]["alert_context"]["analysis_state"]
+    assert update["status"] == "context_extracted"
+    assert events[-1] == {"session_id": "s1", "status": "completed"}
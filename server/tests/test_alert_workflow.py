@@ -0,0 +1,63 @@
+"""
+Tests for the alert workflow node cache.
+"""
+
+from langgraph.cache.base import Namespace
+
+from graph.alert_workflow import (
+    _BoundedInMemoryCache,
+    _alert_analysis_cache_key,
+    _alert_context_cache_key,
+    _initial_alert_state
+)
+from graph.state import AlertAnalysisState, AlertWorkflowState, WorkflowState, create_initial_state
+
+
+def _alert_state(user_context, analysis_state):
+    initial = create_initial_state("alert", session_id="s1", user_context=user_context)
+    return AlertWorkflowState(**dict(initial), analysis_state=analysis_state, remaining_steps=10)
+
+
+def test_initial_alert_state_carries_the_alert_only_fields():
+    state = _initial_alert_state({"labels": {"alertname": "HighCPU"}})
+
+    assert isinstance(state, AlertWorkflowState)
+    assert state.analysis_state == AlertAnalysisState()
+    assert state.user_context["alert_data"] == {"labels": {"alertname": "HighCPU"}}
+    # Query, incident and action runs don't checkpoint the alert loop progress
+    assert "analysis_state" not in WorkflowState.model_fields
+
+
+def test_analysis_key_survives_a_cache_round_trip():
+    context = {"alert_context": {"summary": "HighCPU"}}
+    fresh = AlertAnalysisState(status="complete", iterations=1, confidence_level=0)
+    # A state restored from the cache is validated, so the int becomes 0.0
+    restored = AlertAnalysisState.model_validate(fresh.model_dump())
+
+    assert _alert_analysis_cache_key(_alert_state(context, fresh)) == \
+        _alert_analysis_cache_key(_alert_state(context, restored))
+
+
+def test_context_key_ignores_per_request_fields_and_other_context():
+    alert = {"labels": {"alertname": "HighCPU"}}
+    first = _alert_state({"alert_data": {**alert, "received_at": "t1", "session_id": "a"}}, AlertAnalysisState())
+    repeat = _alert_state(
+        {"alert_data": {**alert, "received_at": "t2", "session_id": "b"}, "tool_results": {"loki": {}}},
+        AlertAnalysisState()
+    )
+    other = _alert_state({"alert_data": {"labels": {"alertname": "DiskFull"}}}, AlertAnalysisState())
+
+    assert _alert_context_cache_key(first) == _alert_context_cache_key(repeat)
+    assert _alert_context_cache_key(first) != _alert_context_cache_key(other)
+
+
+def test_bounded_cache_evicts_oldest_and_expired_entries():
+    cache = _BoundedInMemoryCache(max_entries=2)
+    ns = Namespace(("alert_context",))
+
+    cache.set({(ns, "a"): ({"n": 1}, 300), (ns, "b"): ({"n": 2}, 300)})
+    cache.set({(ns, "expired"): ({"n": 3}, -1)})
+    cache.set({(ns, "c"): ({"n": 4}, 300)})
+
+    assert set(cache._cache[ns]) == {"b", "c"}
+    assert cache.get([(ns, "c")]) == {(ns, "c"): {"n": 4}}
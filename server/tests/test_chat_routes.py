@@ -0,0 +1,34 @@
+"""
+Tests for the chat routes.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routes import chat
+
+
+@pytest.mark.parametrize("query, stream_tokens", [("", False), ("?stream_tokens=true", True)])
+def test_chat_stream_forwards_stream_tokens(query, stream_tokens):
+    calls = []
+
+    async def stream(user_input, session_id=None, stream_tokens=False):
+        calls.append(stream_tokens)
+        if stream_tokens:
+            yield {"partial_output": {"node": "prometheus", "token": "{"}}
+        yield {"result": {"success": True}}
+
+    app = FastAPI()
+    app.include_router(chat.router)
+
+    with patch.object(chat.workflow, "stream", stream):
+        response = TestClient(app).post("/api/v1/chat/stream" + query, json={"message": "cpu usage"})
+
+    events = [json.loads(line[len("data: "):]) for line in response.text.splitlines() if line]
+    assert calls == [stream_tokens]
+    assert events[-1] == {"result": {"success": True}}
+    assert ({"partial_output": {"node": "prometheus", "token": "{"}} in events) is stream_tokens
@@ -0,0 +1,190 @@
+"""
+Tests for the MongoDB checkpointer.
+"""
+
+import asyncio
+import weakref
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langgraph.checkpoint.mongodb.utils import dumps_metadata
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from checkpointing import checkpointer as checkpointer_module
+from checkpointing.checkpointer import PaladinCheckpointer, _CompressingSerializer, get_checkpointer
+
+
+@pytest.fixture
+def checkpointer():
+    """Enabled checkpointer with a mocked saver, as after initialize()."""
+    instance = PaladinCheckpointer()
+    instance.enabled = True
+    instance._checkpointer = MagicMock()
+    instance._checkpointer.aput = AsyncMock()
+    return instance
+
+
+@pytest.mark.asyncio
+async def test_save_checkpoint_goes_through_aput(checkpointer):
+    checkpoint = {"id": "cp-1", "ts": "2025-01-01T00:00:00+00:00"}
+
+    await checkpointer.save_checkpoint("thread-1", checkpoint, {"step": 1}, checkpoint_ns="ns")
+
+    # aput links the parent checkpoint and is awaited, so the write is
+    # visible to the next read
+    checkpointer._checkpointer.aput.assert_awaited_once_with(
+        config=checkpointer.get_config("thread-1", "ns"),
+        checkpoint=checkpoint,
+        metadata={"step": 1},
+        new_versions={}
+    )
+
+
+@pytest.mark.asyncio
+async def test_save_checkpoint_swallows_saver_errors(checkpointer):
+    checkpointer._checkpointer.aput.side_effect = RuntimeError("mongo down")
+
+    await checkpointer.save_checkpoint("thread-1", {"id": "cp-1"})
+
+    checkpointer._checkpointer.aput.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_indexes_ensures_saver_unique_indexes(checkpointer):
+    saver = checkpointer._checkpointer
+    saver.checkpoint_collection.create_index = AsyncMock()
+    saver.writes_collection.create_index = AsyncMock()
+    saver._setup = AsyncMock()
+
+    await checkpointer._create_indexes()
+
+    saver._setup.assert_not_awaited()
+    saver.checkpoint_collection.create_index.assert_any_await(
+        [("thread_id", 1), ("checkpoint_ns", 1), ("checkpoint_id", -1)],
+        unique=True
+    )
+    saver.writes_collection.create_index.assert_any_await(
+        [("thread_id", 1), ("checkpoint_ns", 1), ("checkpoint_id", -1), ("task_id", 1), ("idx", 1)],
+        unique=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_checkpoint_is_a_single_delete_many(checkpointer):
+    collection = MagicMock()
+    collection.delete_many = AsyncMock(return_value=MagicMock(deleted_count=3))
+    checkpointer._collection = collection
+
+    assert await checkpointer.delete_checkpoint("thread-1") is True
+
+    collection.delete_many.assert_awaited_once_with({"checkpoint_ns": "", "thread_id": "thread-1"})
+    collection.aggregate.assert_not_called()
+    checkpointer._checkpointer.writes_collection.delete_many.assert_not_called()
+
+
+def test_get_checkpointer_is_per_loop_and_drops_closed_loops(monkeypatch):
+    monkeypatch.setattr(checkpointer_module, "_checkpointers", weakref.WeakKeyDictionary())
+    monkeypatch.setattr(checkpointer_module, "_init_locks", weakref.WeakKeyDictionary())
+    monkeypatch.setattr(PaladinCheckpointer, "initialize", AsyncMock())
+
+    first_loop = asyncio.new_event_loop()
+    first = first_loop.run_until_complete(get_checkpointer())
+    first_loop.close()
+    second = asyncio.run(get_checkpointer())
+
+    # Keyed by the loop object, so a new loop never inherits a checkpointer
+    # whose client is bound to a closed one, even if ids are reused
+    assert second is not first
+    assert first_loop not in checkpointer_module._checkpointers
+
+
+class FakeCursor:
+    """Async cursor over a fixed list of documents."""
+
+    def __init__(self, docs):
+        self._docs = list(docs)
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._docs:
+            raise StopAsyncIteration
+        return self._docs.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_iter_checkpoints_keeps_the_alist_shape(checkpointer):
+    serde = JsonPlusSerializer()
+    checkpointer._checkpointer.serde = serde
+    checkpoint = {"v": 1, "id": "cp-2", "ts": "2025-01-01T00:00:00+00:00", "channel_values": {"x": 1}}
+    type_, payload = serde.dumps_typed(checkpoint)
+    cursor = FakeCursor([{
+        "thread_id": "thread-1",
+        "checkpoint_ns": "",
+        "checkpoint_id": "cp-2",
+        "parent_checkpoint_id": "cp-1",
+        "type": type_,
+        "checkpoint": payload,
+        "metadata": dumps_metadata({"source": "loop", "step": 2}),
+        "size_bytes": 321
+    }])
+    checkpointer._read_collection = MagicMock()
+    checkpointer._read_collection.find.return_value = cursor
+
+    items = [item async for item in checkpointer.iter_checkpoints("thread-1")]
+
+    assert items == [{
+        "config": {"configurable": {"thread_id": "thread-1", "checkpoint_ns": "", "checkpoint_id": "cp-2"}},
+        "checkpoint": checkpoint,
+        "metadata": {"source": "loop", "step": 2},
+        "parent_config": {"configurable": {"thread_id": "thread-1", "checkpoint_ns": "", "checkpoint_id": "cp-1"}},
+        "thread_id": "thread-1",
+        "checkpoint_ns": "",
+        "checkpoint_id": "cp-2",
+        "timestamp": "2025-01-01T00:00:00+00:00",
+        "size_bytes": 321
+    }]
+    assert cursor.closed
+
+
+LARGE_VALUE = {"channel_values": {"output": "x" * 4096}}
+
+
+def test_serializer_leaves_values_untouched_by_default():
+    serde = JsonPlusSerializer()
+    wrapper = _CompressingSerializer(serde, threshold_bytes=1024)
+
+    # A plain saver writes exactly the same bytes, so it can read them back
+    assert wrapper.dumps_typed(LARGE_VALUE) == serde.dumps_typed(LARGE_VALUE)
+
+
+def test_serializer_round_trips_compressed_values():
+    serde = JsonPlusSerializer()
+    wrapper = _CompressingSerializer(serde, threshold_bytes=1024, compress=True)
+
+    type_, data = wrapper.dumps_typed(LARGE_VALUE)
+
+    assert type_.endswith("+zstd")
+    assert len(data) < len(serde.dumps_typed(LARGE_VALUE)[1])
+    assert wrapper.loads_typed((type_, data)) == LARGE_VALUE
+
+
+def test_serializer_keeps_small_values_uncompressed():
+    serde = JsonPlusSerializer()
+    wrapper = _CompressingSerializer(serde, threshold_bytes=1024, compress=True)
+    small = {"step": 1}
+
+    assert wrapper.dumps_typed(small) == serde.dumps_typed(small)
+    assert wrapper.loads_typed(serde.dumps_typed(small)) == small
+
+
+def test_serializer_reads_compressed_values_after_opting_out():
+    serde = JsonPlusSerializer()
+    stored = _CompressingSerializer(serde, threshold_bytes=1024, compress=True).dumps_typed(LARGE_VALUE)
+
+    assert _CompressingSerializer(serde, threshold_bytes=1024).loads_typed(stored) == LARGE_VALUE
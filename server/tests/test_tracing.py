@@ -0,0 +1,32 @@
+"""
+Tests for the tracing switch.
+"""
+
+import pytest
+
+from utils import tracing
+
+
+@pytest.fixture
+def langfuse_keys(monkeypatch):
+    monkeypatch.setenv("LANGFUSE_PUBLIC_KEY", "pk")
+    monkeypatch.setenv("LANGFUSE_SECRET_KEY", "sk")
+    monkeypatch.setenv("LANGFUSE_ENABLED", "true")
+    monkeypatch.setenv("ENABLE_TRACING", "true")
+
+
+def test_tracing_enabled_with_keys(langfuse_keys):
+    assert tracing._tracing_enabled()
+
+
+@pytest.mark.parametrize("flag", ["LANGFUSE_ENABLED", "ENABLE_TRACING"])
+def test_tracing_disabled_by_either_flag(langfuse_keys, monkeypatch, flag):
+    monkeypatch.setenv(flag, "false")
+
+    assert not tracing._tracing_enabled()
+
+
+def test_tracing_disabled_without_keys(langfuse_keys, monkeypatch):
+    monkeypatch.delenv("LANGFUSE_SECRET_KEY")
+
+    assert not tracing._tracing_enabled()
@@ -0,0 +1,75 @@
+"""
+Tests for the workflow state schemas.
+"""
+
+import pytest
+from langgraph.graph import StateGraph, END
+
+from graph.state import AlertWorkflowState, WorkflowState, create_initial_state
+
+
+def _fan_out_graph(schema):
+    """Graph where two nodes update user_context in the same step."""
+    async def left(state):
+        return {"user_context": {"rag_context": "docs"}}
+
+    async def right(state):
+        return {"user_context": {"memory_context": "history"}}
+
+    graph = StateGraph(schema)
+    graph.add_node("left", left)
+    graph.add_node("right", right)
+    graph.set_entry_point("left")
+    graph.set_entry_point("right")
+    graph.add_edge("left", END)
+    graph.add_edge("right", END)
+    return graph.compile()
+
+
+@pytest.mark.asyncio
+async def test_alert_state_merges_parallel_user_context_updates():
+    state = create_initial_state("alert", session_id="s1", user_context={"alert_data": {"labels": {}}})
+
+    result = await _fan_out_graph(AlertWorkflowState).ainvoke(state)
+
+    assert result["user_context"] == {
+        "alert_data": {"labels": {}},
+        "rag_context": "docs",
+        "memory_context": "history"
+    }
+
+
+@pytest.mark.asyncio
+async def test_workflow_state_replaces_user_context():
+    async def update(state):
+        return {"user_context": {"replaced": True}}
+
+    graph = StateGraph(WorkflowState)
+    graph.add_node("update", update)
+    graph.set_entry_point("update")
+    graph.add_edge("update", END)
+    state = create_initial_state("query", session_id="s1", user_context={"old": 1})
+
+    result = await graph.compile().ainvoke(state)
+
+    assert result["user_context"] == {"replaced": True}
+
+
+@pytest.mark.asyncio
+async def test_alert_state_receives_remaining_steps():
+    seen = []
+
+    async def record(state):
+        seen.append(state.remaining_steps)
+        return {"user_context": {"seen": True}}
+
+    graph = StateGraph(AlertWorkflowState)
+    graph.add_node("record", record)
+    graph.set_entry_point("record")
+    graph.add_edge("record", END)
+    state = create_initial_state("alert", session_id="s1", user_context={})
+
+    await graph.compile().ainvoke(state, {"recursion_limit": 10})
+
+    assert seen == [9]
+    assert "remaining_steps" not in WorkflowState.model_fields
@@ -0,0 +1,47 @@
+"""
+Tests for PaladinWorkflow streaming.
+"""
+
+import pytest
+
+from graph.workflow import PaladinWorkflow
+
+
+class FakeGraph:
+    """Compiled graph stub that replays (mode, chunk) pairs for the requested modes."""
+
+    def __init__(self):
+        self.stream_mode = None
+
+    async def astream(self, initial_state, config=None, stream_mode=None):
+        self.stream_mode = stream_mode
+        events = [("custom", {"node": "prometheus", "token": "{"}), ("updates", {"categorize": {}})]
+        for mode, chunk in events:
+            if mode in stream_mode:
+                yield mode, chunk
+
+
+def _workflow():
+    workflow = PaladinWorkflow.__new__(PaladinWorkflow)
+    workflow.checkpointer = None
+    workflow.graph = FakeGraph()
+    return workflow
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_only_updates_by_default():
+    workflow = _workflow()
+
+    events = [event async for event in workflow.stream("cpu usage", "s1")]
+
+    assert events == [{"categorize": {}}]
+    assert workflow.graph.stream_mode == ["updates"]
+
+
+@pytest.mark.asyncio
+async def test_stream_wraps_partial_output_when_requested():
+    workflow = _workflow()
+
+    events = [event async for event in workflow.stream("cpu usage", "s1", stream_tokens=True)]
+
+    assert events == [{"partial_output": {"node": "prometheus", "token": "{"}}, {"categorize": {}}]
@@ -7,7 +7,7 @@ import os
 import aiohttp
 from typing import Dict, List, Optional, Any
 from dotenv import load_dotenv
-from langfuse import observe
+from utils.tracing import observe
 
 from .models import (
     AlertmanagerAlertsResponse,
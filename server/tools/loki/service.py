@@ -7,7 +7,7 @@ import os
 import aiohttp
 from typing import Dict, List, Optional, Any, Union, Tuple
 from dotenv import load_dotenv
-from langfuse import observe
+from utils.tracing import observe
 
 from .models import (
     LokiQueryRequest,
@@ -0,0 +1,43 @@
+"""
+Tracing Utilities for PaladinAI Server.
+
+This module exposes the Langfuse ``observe`` decorator when tracing is
+enabled and configured, and a pass-through decorator otherwise so traced
+functions carry no span overhead in deployments without Langfuse.
+"""
+
+import os
+
+from dotenv import load_dotenv
+
+# The decorator is chosen at import time, which can precede the importing
+# module's own load_dotenv call
+load_dotenv()
+
+
+def _env_flag(name: str) -> bool:
+    """Boolean environment flag that defaults to on."""
+    return os.getenv(name, "true").lower() == "true"
+
+
+def _tracing_enabled() -> bool:
+    """
+    Tracing requires the Langfuse keys and can be switched off with either
+    LANGFUSE_ENABLED=false or ENABLE_TRACING=false.
+    """
+    return (
+        _env_flag("LANGFUSE_ENABLED")
+        and _env_flag("ENABLE_TRACING")
+        and bool(os.getenv("LANGFUSE_PUBLIC_KEY"))
+        and bool(os.getenv("LANGFUSE_SECRET_KEY"))
+    )
+
+
+if _tracing_enabled():
+    from langfuse import observe
+else:
+    def observe(*args, **kwargs):
+        """Stand-in for langfuse.observe that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func